@@ -14,21 +14,86 @@ Installation:
 
 import time
 import random
+import asyncio
 import json
+import re
 import logging
+import os
 import hashlib
+import html
+import queue
+import struct
+import weakref
+from contextlib import ExitStack, nullcontext
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from IPython.display import display, clear_output, HTML
 import ipywidgets as widgets
-from threading import Thread, Event
+from threading import Thread, Event, Timer, Lock, RLock
+
+try:
+    from tornado.ioloop import IOLoop, PeriodicCallback
+except ImportError:  # tornado ships with ipykernel; only missing outside Jupyter
+    IOLoop = PeriodicCallback = None
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 
 # ============================================================================
 # ENHANCED HITL REVIEW DASHBOARD
 # ============================================================================
 
+_KEYBOARD_HELP_HTML = """
+<div style="background: #e8f4f8; padding: 8px; border-radius: 5px; margin: 5px 0;">
+    <strong>⌨️ Keyboard Shortcuts:</strong>
+    <span style="margin-left: 10px;">
+        <kbd>A</kbd> Approve |
+        <kbd>R</kbd> Reject |
+        <kbd>E</kbd> Edit Mode |
+        <kbd>S</kbd> Save |
+        <kbd>N</kbd> Next |
+        <kbd>P</kbd> Previous |
+        <kbd>Q</kbd> Skip
+    </span>
+</div>
+"""
+
+
+class ReviewStats:
+    """Running review counters for one dashboard session."""
+
+    __slots__ = ('approved', 'rejected', 'skipped', 'total_review_time', 'reviews_count')
+
+    def __init__(self):
+        self.approved = 0
+        self.rejected = 0
+        self.skipped = 0
+        self.total_review_time = 0.0
+        self.reviews_count = 0
+
+    @property
+    def avg_review_time(self) -> float:
+        """Mean seconds spent per recorded review."""
+        return self.total_review_time / self.reviews_count if self.reviews_count else 0.0
+
+
 class EnhancedHITLReviewDashboard:
     """
     Enhanced Interactive dashboard for reviewing queue items with:
@@ -39,31 +104,76 @@ class EnhancedHITLReviewDashboard:
     - Review time tracking
     """
 
-    def __init__(self, review_queue, auto_refresh_interval: int = 30):
+    # Bursts of navigation clicks/keypresses within this window render once
+    UPDATE_DEBOUNCE_SECONDS = 0.05
+
+    # Static HTML scaffolding for the status/item panels; only the fields change per render
+    _STATUS_TPL = (
+        '<h3>Review Item {index} of {total}</h3>'
+        '<div style="background: #e0e0e0; border-radius: 5px; height: 20px; margin: 10px 0;">'
+        '<div style="background: #4CAF50; width: {pct:.1f}%; height: 100%; border-radius: 5px; '
+        'transition: width 0.3s;"></div>'
+        '</div>'
+        '<p><strong>Source Agent:</strong> {agent} | <strong>Item ID:</strong> {item_id}</p>'
+        '<p><strong>Overall Progress:</strong> {pct:.1f}% complete</p>'
+    )
+    _ITEM_TPL = (
+        '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px; max-height: 400px; overflow-y: auto;">'
+        '<h4>Source Data:</h4>'
+        '<pre style="background: white; padding: 10px; border-radius: 3px; overflow-x: auto;">{source}</pre>'
+        '<h4>Generated Content:</h4>'
+        '<div style="background: white; padding: 10px; border-radius: 3px;">{content}</div>'
+        '</div>'
+    )
+
+    # Characters of source data / generated content shown in the item preview
+    SOURCE_PREVIEW_CHARS = 300
+    CONTENT_PREVIEW_CHARS = 1500
+
+    # Idle auto-refresh backs off by this factor per unchanged poll, up to the cap
+    AUTO_REFRESH_BACKOFF = 1.5
+    MAX_AUTO_REFRESH_INTERVAL = 300
+
+    def __init__(self, review_queue, auto_refresh_interval: int = 30,
+                 pending_cache_ttl: float = 60):
         self.review_queue = review_queue
+        # Guards current_items/current_index/stats, which the refresh thread and
+        # widget handlers both mutate. Widget writes and queue I/O happen outside it.
+        self._lock = RLock()
         self.current_job_id = None
         self.current_items = []
         self.current_index = 0
         self.auto_refresh_enabled = True
         self.auto_refresh_interval = auto_refresh_interval
+        self._current_refresh_interval = auto_refresh_interval
         self.refresh_thread = None
+        self._refresh_callback = None
         self.stop_refresh = Event()
+        self._refresh_wake = Event()  # wakes an idle refresh thread when its settings change
         self.edit_mode = False
+        self._edit_item_id = None  # item whose content is currently loaded in edit_area
         self.review_start_time = None
-        self.stats = {
-            'approved': 0,
-            'rejected': 0,
-            'skipped': 0,
-            'total_review_time': 0,
-            'reviews_count': 0
-        }
+        # (ioloop or None, timeout handle or Timer) of the scheduled render, and a
+        # counter that lets a superseded render that already started drop itself
+        self._update_lock = Lock()
+        self._pending_update = None
+        self._update_generation = 0
+        self.pending_cache_ttl = pending_cache_ttl
+        self._pending_cache = {}  # job_id -> (fetched_at, queue_version, items)
+        self._previews = {}  # item_id -> (escaped source preview, escaped content preview)
+        self._reviewed_ids = set()  # approved/rejected here; hidden even if the queue still lists them
+        self._items_signature = None  # digest of the item ids last loaded into the display
+        self._stats_signature = None  # counters last rendered into stats_html
+        self._dashboard = None  # layout built by the first create_widget call
+        self._job_input = None
+        self.stats = ReviewStats()
 
         # Widgets
         self.output = widgets.Output()
         self.status_html = widgets.HTML()
         self.item_html = widgets.HTML()
         self.stats_html = widgets.HTML()
-        self.keyboard_help_html = widgets.HTML(value=self._get_keyboard_help())
+        self.keyboard_help_html = widgets.HTML(value=_KEYBOARD_HELP_HTML)
 
         self.edit_area = widgets.Textarea(
             value='',
@@ -140,60 +250,86 @@ class EnhancedHITLReviewDashboard:
             icon='filter'
         )
 
-    def _get_keyboard_help(self):
-        """Get keyboard shortcuts help HTML."""
-        return """
-        <div style="background: #e8f4f8; padding: 8px; border-radius: 5px; margin: 5px 0;">
-            <strong>⌨️ Keyboard Shortcuts:</strong>
-            <span style="margin-left: 10px;">
-                <kbd>A</kbd> Approve |
-                <kbd>R</kbd> Reject |
-                <kbd>E</kbd> Edit Mode |
-                <kbd>S</kbd> Save |
-                <kbd>N</kbd> Next |
-                <kbd>P</kbd> Previous |
-                <kbd>Q</kbd> Skip
-            </span>
-        </div>
-        """
+    @staticmethod
+    def _kernel_loop_running() -> bool:
+        """True when called from the kernel's (tornado/asyncio) event loop."""
+        if PeriodicCallback is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
 
     def _start_auto_refresh(self):
-        """Start auto-refresh background thread."""
+        """
+        Start auto-refresh.
+
+        Inside a Jupyter kernel the refresh is scheduled with a tornado
+        PeriodicCallback, so widget updates happen on the kernel's event loop
+        (ipywidgets comms are not thread-safe). Elsewhere a background thread
+        is used instead.
+        """
+        if self._refresh_callback is not None and self._refresh_callback.is_running():
+            return
         if self.refresh_thread and self.refresh_thread.is_alive():
             return
 
-        self.stop_refresh.clear()
-        self.refresh_thread = Thread(target=self._auto_refresh_loop, daemon=True)
-        self.refresh_thread.start()
+        if self._kernel_loop_running():
+            self._refresh_callback = PeriodicCallback(
+                self._refresh_on_ioloop, self._current_refresh_interval * 1000
+            )
+            self._refresh_callback.start()
+        else:
+            self.stop_refresh.clear()
+            self.refresh_thread = Thread(target=self._auto_refresh_loop, daemon=True)
+            self.refresh_thread.start()
         print(f"🔄 Auto-refresh enabled (every {self.auto_refresh_interval}s)")
 
     def _stop_auto_refresh(self):
-        """Stop auto-refresh background thread."""
+        """Stop auto-refresh (periodic callback or background thread)."""
+        if self._refresh_callback is not None:
+            self._refresh_callback.stop()
+            self._refresh_callback = None
         self.stop_refresh.set()
+        self._refresh_wake.set()
         if self.refresh_thread:
             self.refresh_thread.join(timeout=2)
         print("⏸️  Auto-refresh disabled")
 
+    def _refresh_on_ioloop(self):
+        """PeriodicCallback target; reschedules itself at the adapted interval."""
+        if self.auto_refresh_checkbox.value and self.current_job_id:
+            self._refresh_items(silent=True)
+        if self._refresh_callback is not None:
+            self._refresh_callback.callback_time = self._current_refresh_interval * 1000
+
     def _auto_refresh_loop(self):
         """Background loop for auto-refresh."""
         while not self.stop_refresh.is_set():
             if self.auto_refresh_checkbox.value and self.current_job_id:
-                time.sleep(self.auto_refresh_interval)
-                if not self.stop_refresh.is_set():
-                    self._refresh_items(silent=True)
+                if self.stop_refresh.wait(self._current_refresh_interval):
+                    break
+                self._refresh_items(silent=True)
             else:
-                time.sleep(5)  # Check every 5 seconds if refresh is enabled
+                # Idle until the checkbox/job changes (or a minute passes) instead of polling
+                self._refresh_wake.wait(timeout=60)
+                self._refresh_wake.clear()
 
-    def _refresh_items(self, silent=False):
-        """Refresh pending items."""
+    def _refresh_items(self, silent=False, force=False):
+        """Refresh pending items (force=True bypasses the pending-items cache)."""
         if not silent:
             with self.output:
                 clear_output()
                 print(f'🔄 Refreshing items for job {self.current_job_id}...')
 
-        old_count = len(self.current_items)
-        self.load_pending_items()
+        with self._lock:
+            old_ids = [item.item_id for item in self.current_items]
+        old_count = len(old_ids)
+        self.load_pending_items(force=force)
         new_count = len(self.current_items)
+        changed = [item.item_id for item in self.current_items] != old_ids
+        self._adapt_refresh_interval(changed or force)
 
         if not silent and new_count != old_count:
             with self.output:
@@ -201,42 +337,199 @@ class EnhancedHITLReviewDashboard:
 
         self.update_stats_display()
 
-    def load_pending_items(self):
-        """Load pending items from the review queue."""
-        self.current_items = self.review_queue.get_pending_items(self.current_job_id)
-        if self.current_index >= len(self.current_items):
-            self.current_index = max(0, len(self.current_items) - 1)
+    def _adapt_refresh_interval(self, active: bool):
+        """Poll at the base interval while the queue churns; back off while it is idle."""
+        if active:
+            self._current_refresh_interval = self.auto_refresh_interval
+        else:
+            self._current_refresh_interval = min(
+                self._current_refresh_interval * self.AUTO_REFRESH_BACKOFF,
+                self.MAX_AUTO_REFRESH_INTERVAL
+            )
+
+    def _fetch_pending_items(self, force: bool = False) -> List:
+        """
+        Fetch pending items, reusing a recent result for the same job.
+
+        If the review queue exposes ``pending_version(job_id)``, the cached list is
+        reused for as long as that version is unchanged; otherwise it is reused for
+        ``pending_cache_ttl`` seconds. Auto-refresh therefore stops re-running the
+        full pending-items query when nothing new has arrived.
+        """
+        job_id = self.current_job_id
+        version_fn = getattr(self.review_queue, 'pending_version', None)
+        version = version_fn(job_id) if callable(version_fn) else None
+
+        cached = self._pending_cache.get(job_id)
+        if cached is not None and not force:
+            fetched_at, cached_version, items = cached
+            if version is not None:
+                if version == cached_version:
+                    return list(items)
+            elif time.time() - fetched_at < self.pending_cache_ttl:
+                return list(items)
+
+        items = self.review_queue.get_pending_items(job_id)
+        self._pending_cache[job_id] = (time.time(), version, items)
+        return list(items)
+
+    def _mark_reviewed(self, item_ids: List[int]):
+        """Record local approvals/rejections and drop the now-stale cached pending items."""
+        with self._lock:
+            self._reviewed_ids.update(item_ids)
+            self._pending_cache.pop(self.current_job_id, None)
+            self._items_signature = None
+
+    def _clamp_index(self):
+        """Keep current_index within current_items (0 when the list is empty)."""
+        self.current_index = min(self.current_index, max(0, len(self.current_items) - 1))
+
+    def load_pending_items(self, force: bool = False):
+        """Load pending items from the review queue, dropping duplicates and reviewed items."""
+        fetched = self._fetch_pending_items(force=force)
+
+        with self._lock:
+            # seen starts with locally reviewed ids so items whose approval has not
+            # reached the queue yet (or that a concurrent refresh returns twice) show once
+            seen = set(self._reviewed_ids)
+            items = []
+            for item in fetched:
+                if item.item_id not in seen:
+                    seen.add(item.item_id)
+                    items.append(item)
+
+            # Skip the re-render (and its comm traffic) when a refresh finds the same items
+            signature = hashlib.blake2b(
+                ','.join(str(item.item_id) for item in items).encode(), digest_size=8
+            ).digest()
+            if signature == self._items_signature and not force:
+                return
+            self._items_signature = signature
+
+            self.current_items = items
+            current_ids = {item.item_id for item in self.current_items}
+            self._previews = {item_id: preview for item_id, preview in self._previews.items()
+                              if item_id in current_ids}
+            self._clamp_index()
         self.update_display()
 
     def update_stats_display(self):
         """Update statistics display."""
-        avg_review_time = (self.stats['total_review_time'] / self.stats['reviews_count']
-                          if self.stats['reviews_count'] > 0 else 0)
+        with self._lock:
+            pending = len(self.current_items)
+            approved, rejected, skipped = self.stats.approved, self.stats.rejected, self.stats.skipped
+            reviews_count = self.stats.reviews_count
+            avg_review_time = self.stats.avg_review_time
+
+        # Navigation leaves every counter unchanged; don't rebuild/resend the table then
+        signature = (pending, approved, rejected, skipped, reviews_count, avg_review_time)
+        if signature == self._stats_signature:
+            return
+        self._stats_signature = signature
 
         self.stats_html.value = f"""
         <div style="background: #f0f0f0; padding: 10px; border-radius: 5px; margin: 10px 0;">
             <h4 style="margin-top: 0;">📊 Review Statistics</h4>
             <table style="width: 100%;">
                 <tr>
-                    <td><strong>Pending:</strong> {len(self.current_items)}</td>
-                    <td><strong>Approved:</strong> {self.stats['approved']}</td>
-                    <td><strong>Rejected:</strong> {self.stats['rejected']}</td>
-                    <td><strong>Skipped:</strong> {self.stats['skipped']}</td>
+                    <td><strong>Pending:</strong> {pending}</td>
+                    <td><strong>Approved:</strong> {approved}</td>
+                    <td><strong>Rejected:</strong> {rejected}</td>
+                    <td><strong>Skipped:</strong> {skipped}</td>
                 </tr>
                 <tr>
-                    <td colspan="2"><strong>Total Reviews:</strong> {self.stats['reviews_count']}</td>
+                    <td colspan="2"><strong>Total Reviews:</strong> {reviews_count}</td>
                     <td colspan="2"><strong>Avg Time:</strong> {avg_review_time:.1f}s</td>
                 </tr>
             </table>
         </div>
         """
 
+    def _schedule_update(self):
+        """
+        Debounce display updates so rapid navigation collapses into one render.
+
+        Like auto-refresh, the render runs on the kernel's event loop when
+        there is one (ipywidgets comms are not thread-safe); elsewhere a Timer
+        thread is used.
+        """
+        with self._update_lock:
+            self._cancel_update()
+            self._update_generation += 1
+            generation = self._update_generation
+            if self._kernel_loop_running():
+                loop = IOLoop.current()
+                handle = loop.call_later(self.UPDATE_DEBOUNCE_SECONDS, self._flush_update, generation)
+                self._pending_update = (loop, handle)
+            else:
+                timer = Timer(self.UPDATE_DEBOUNCE_SECONDS, self._flush_update, args=(generation,))
+                timer.daemon = True
+                self._pending_update = (None, timer)
+                timer.start()
+
+    def _cancel_update(self):
+        """Cancel the scheduled render, if any. Call with _update_lock held."""
+        if self._pending_update is not None:
+            loop, handle = self._pending_update
+            if loop is None:
+                handle.cancel()
+            else:
+                loop.remove_timeout(handle)
+            self._pending_update = None
+
+    def _flush_update(self, generation: int):
+        """Run the display update scheduled by _schedule_update, unless superseded."""
+        with self._update_lock:
+            if generation != self._update_generation:
+                return
+            self._pending_update = None
+        self.update_display()
+
+    @staticmethod
+    def _truncate(text: str, limit: int) -> str:
+        """Cut text to limit characters, marking the cut with an ellipsis."""
+        return text[:limit] + '...' if len(text) > limit else text
+
+    def _get_previews(self, item) -> Tuple[str, str]:
+        """HTML-escaped source/content previews for an item, built once per item."""
+        previews = self._previews.get(item.item_id)
+        if previews is None:
+            previews = (
+                html.escape(self._truncate(item.source_data, self.SOURCE_PREVIEW_CHARS), quote=False),
+                html.escape(self._truncate(item.generated_content, self.CONTENT_PREVIEW_CHARS), quote=False),
+            )
+            self._previews[item.item_id] = previews
+        return previews
+
+    def _display_widgets(self):
+        """Widgets whose state is rewritten by update_display."""
+        return (
+            self.status_html, self.item_html, self.stats_html, self.edit_area,
+            self.prev_button, self.next_button, self.approve_button, self.reject_button,
+            self.skip_button, self.edit_toggle_button, self.batch_approve_button,
+            self.batch_by_agent_button,
+        )
+
     def update_display(self):
-        """Update the dashboard display."""
-        if not self.current_items:
+        """Update the dashboard display, syncing each widget's changes in one message."""
+        with ExitStack() as stack:
+            for widget in self._display_widgets():
+                stack.enter_context(widget.hold_sync())
+            self._render_display()
+
+    def _render_display(self):
+        """Write the current item's state into the dashboard widgets."""
+        with self._lock:
+            total = len(self.current_items)
+            index = self.current_index
+            item = self.current_items[index] if total else None
+            decided = self.stats.approved + self.stats.rejected
+
+        if item is None:
             self.status_html.value = '<h3 style="color: green;">✓ No pending items</h3>'
             self.item_html.value = '<p>All items have been reviewed!</p>'
             self.edit_area.value = ''
+            self._edit_item_id = None
             self.prev_button.disabled = True
             self.next_button.disabled = True
             self.approve_button.disabled = True
@@ -247,45 +540,36 @@ class EnhancedHITLReviewDashboard:
             self.batch_by_agent_button.disabled = True
             return
 
-        item = self.current_items[self.current_index]
-
         # Start review timer
         if self.review_start_time is None:
             self.review_start_time = time.time()
 
         # Update status with progress bar
-        progress_pct = ((self.stats['approved'] + self.stats['rejected']) /
-                       (len(self.current_items) + self.stats['approved'] + self.stats['rejected']) * 100
-                       if (len(self.current_items) + self.stats['approved'] + self.stats['rejected']) > 0 else 0)
-
-        self.status_html.value = f'''
-        <h3>Review Item {self.current_index + 1} of {len(self.current_items)}</h3>
-        <div style="background: #e0e0e0; border-radius: 5px; height: 20px; margin: 10px 0;">
-            <div style="background: #4CAF50; width: {progress_pct:.1f}%; height: 100%; border-radius: 5px; transition: width 0.3s;"></div>
-        </div>
-        <p><strong>Source Agent:</strong> {item.source_agent} | <strong>Item ID:</strong> {item.item_id}</p>
-        <p><strong>Overall Progress:</strong> {progress_pct:.1f}% complete</p>
-        '''
+        progress_pct = decided / (total + decided) * 100
+
+        self.status_html.value = self._STATUS_TPL.format(
+            index=index + 1,
+            total=total,
+            pct=progress_pct,
+            agent=item.source_agent,
+            item_id=item.item_id
+        )
 
         # Update item display
-        source_preview = item.source_data[:300] + '...' if len(item.source_data) > 300 else item.source_data
-        content_preview = item.generated_content[:1500] + '...' if len(item.generated_content) > 1500 else item.generated_content
-
-        self.item_html.value = f'''
-        <div style="background: #f5f5f5; padding: 10px; border-radius: 5px; max-height: 400px; overflow-y: auto;">
-            <h4>Source Data:</h4>
-            <pre style="background: white; padding: 10px; border-radius: 3px; overflow-x: auto;">{source_preview}</pre>
-            <h4>Generated Content:</h4>
-            <div style="background: white; padding: 10px; border-radius: 3px;">{content_preview}</div>
-        </div>
-        '''
+        source_preview, content_preview = self._get_previews(item)
+        self.item_html.value = self._ITEM_TPL.format(source=source_preview, content=content_preview)
 
-        # Update edit area
-        self.edit_area.value = item.generated_content
+        # Update edit area: it is only filled once editing starts, so large content
+        # is not shipped to the frontend on every navigation
+        if self.edit_mode:
+            self._load_edit_buffer(item)
+        elif self._edit_item_id not in (None, item.item_id):
+            self.edit_area.value = ''
+            self._edit_item_id = None
 
         # Update navigation buttons
-        self.prev_button.disabled = self.current_index == 0
-        self.next_button.disabled = self.current_index == len(self.current_items) - 1
+        self.prev_button.disabled = index == 0
+        self.next_button.disabled = index == total - 1
 
         # Enable action buttons
         self.approve_button.disabled = False
@@ -297,9 +581,19 @@ class EnhancedHITLReviewDashboard:
 
         self.update_stats_display()
 
+    def _load_edit_buffer(self, item):
+        """Put an item's generated content into the edit area unless it is already there."""
+        if self._edit_item_id != item.item_id:
+            self.edit_area.value = item.generated_content
+            self._edit_item_id = item.item_id
+
     def toggle_edit_mode(self):
         """Toggle edit mode."""
         self.edit_mode = not self.edit_mode
+        with self._lock:
+            item = self.current_items[self.current_index] if self.current_items else None
+        if self.edit_mode and item is not None:
+            self._load_edit_buffer(item)
         self.edit_area.disabled = not self.edit_mode
         self.save_button.disabled = not self.edit_mode
 
@@ -318,17 +612,45 @@ class EnhancedHITLReviewDashboard:
         """Record the time taken for this review."""
         if self.review_start_time:
             review_time = time.time() - self.review_start_time
-            self.stats['total_review_time'] += review_time
-            self.stats['reviews_count'] += 1
+            self.stats.total_review_time += review_time
+            self.stats.reviews_count += 1
             self.review_start_time = None
 
+    def _approve_items(self, item_ids: List[int]):
+        """
+        Approve several items with as few review-queue round-trips as possible.
+
+        Uses the queue's batched ``approve_items`` when available; otherwise the
+        per-item calls share one database transaction if the queue's db supports it.
+        """
+        self._mark_reviewed(item_ids)
+        if hasattr(self.review_queue, 'approve_items'):
+            self.review_queue.approve_items(item_ids)
+            return
+
+        transaction = getattr(getattr(self.review_queue, 'db', None), 'transaction', None)
+        with transaction() if callable(transaction) else nullcontext():
+            for item_id in item_ids:
+                self.review_queue.approve_item(item_id)
+
     def create_widget(self, job_id: str):
-        """Create the enhanced review dashboard interface."""
+        """
+        Create the enhanced review dashboard interface.
+
+        The layout is built and its handlers wired only once; later calls switch
+        the existing dashboard to ``job_id`` and return it, so re-running a cell
+        neither duplicates frontend widgets nor attaches handlers twice.
+        """
         self.current_job_id = job_id
+        if self._dashboard is not None:
+            self._job_input.value = job_id
+            self._refresh_items(silent=True, force=True)
+            return self._dashboard
+
         self.load_pending_items()
 
         # Job ID input
-        job_input = widgets.Text(
+        self._job_input = job_input = widgets.Text(
             value=job_id,
             description='Job ID:',
             disabled=False
@@ -337,48 +659,62 @@ class EnhancedHITLReviewDashboard:
         # Event handlers
         def on_refresh(b):
             self.current_job_id = job_input.value
-            self._refresh_items()
+            self._refresh_items(force=True)
+            self._refresh_wake.set()
 
         def on_auto_refresh_toggle(change):
+            self._refresh_wake.set()
             if change['new']:
                 self._start_auto_refresh()
             else:
                 self._stop_auto_refresh()
 
         def on_prev(b):
-            if self.current_index > 0:
+            with self._lock:
+                if self.current_index == 0:
+                    return
                 self.current_index -= 1
                 self.review_start_time = time.time()
-                self.update_display()
+            self._schedule_update()
 
         def on_next(b):
-            if self.current_index < len(self.current_items) - 1:
+            with self._lock:
+                if self.current_index >= len(self.current_items) - 1:
+                    return
                 self.current_index += 1
                 self.review_start_time = time.time()
-                self.update_display()
+            self._schedule_update()
 
-        def on_approve(b):
-            if not self.current_items:
-                return
+        def _remove_current(item_id):
+            """Drop a reviewed item by id (a refresh may have moved it meanwhile)."""
+            self.current_items = [item for item in self.current_items if item.item_id != item_id]
+            self._clamp_index()
+            self.review_start_time = time.time() if self.current_items else None
 
-            item = self.current_items[self.current_index]
-            approved_content = self.edit_area.value
+        def on_approve(b):
+            with self._lock:
+                if not self.current_items:
+                    return
+                item = self.current_items[self.current_index]
+            # Only items opened in the editor carry edited content; None approves as generated
+            approved_content = self.edit_area.value if self._edit_item_id == item.item_id else None
 
             with self.output:
                 clear_output()
                 self.review_queue.approve_item(item.item_id, approved_content)
                 print(f'✓ Approved item {item.item_id}')
 
-            self._record_review_time()
-            self.stats['approved'] += 1
-            self.current_items.pop(self.current_index)
-            if self.current_index >= len(self.current_items) and self.current_index > 0:
-                self.current_index -= 1
-            self.review_start_time = time.time() if self.current_items else None
+            with self._lock:
+                self._mark_reviewed([item.item_id])
+                self._record_review_time()
+                self.stats.approved += 1
+                _remove_current(item.item_id)
             self.update_display()
 
         def on_reject(b):
-            if not self.current_items:
+            with self._lock:
+                item = self.current_items[self.current_index] if self.current_items else None
+            if item is None:
                 return
 
             if not self.feedback_area.value:
@@ -387,36 +723,34 @@ class EnhancedHITLReviewDashboard:
                     print('❌ Please provide feedback before rejecting')
                 return
 
-            item = self.current_items[self.current_index]
-
             with self.output:
                 clear_output()
                 self.review_queue.reject_item(item.item_id, self.feedback_area.value)
                 print(f'❌ Rejected item {item.item_id}')
 
-            self._record_review_time()
-            self.stats['rejected'] += 1
-            self.current_items.pop(self.current_index)
-            if self.current_index >= len(self.current_items) and self.current_index > 0:
-                self.current_index -= 1
+            with self._lock:
+                self._mark_reviewed([item.item_id])
+                self._record_review_time()
+                self.stats.rejected += 1
+                _remove_current(item.item_id)
             self.feedback_area.value = ''
-            self.review_start_time = time.time() if self.current_items else None
             self.update_display()
 
         def on_skip(b):
             """Skip to next item without action."""
-            if not self.current_items:
-                return
+            with self._lock:
+                if not self.current_items:
+                    return
+                item_id = self.current_items[self.current_index].item_id
+                self.stats.skipped += 1
+                if self.current_index < len(self.current_items) - 1:
+                    self.current_index += 1
+                self.review_start_time = time.time()
 
             with self.output:
                 clear_output()
-                print(f'⏭️  Skipped item {self.current_items[self.current_index].item_id}')
-
-            self.stats['skipped'] += 1
-            if self.current_index < len(self.current_items) - 1:
-                self.current_index += 1
-            self.review_start_time = time.time()
-            self.update_display()
+                print(f'⏭️  Skipped item {item_id}')
+            self._schedule_update()
 
         def on_edit_toggle(b):
             self.toggle_edit_mode()
@@ -431,39 +765,50 @@ class EnhancedHITLReviewDashboard:
 
         def on_batch_approve_all(b):
             """Approve all remaining items."""
-            if not self.current_items:
+            with self._lock:
+                ids_to_approve = [item.item_id for item in self.current_items]
+            if not ids_to_approve:
                 return
 
-            count = len(self.current_items)
+            approved_ids = set(ids_to_approve)
+            count = len(ids_to_approve)
             with self.output:
                 clear_output()
                 print(f'Approving {count} items...')
-                for item in self.current_items:
-                    self.review_queue.approve_item(item.item_id)
+                self._approve_items(ids_to_approve)
                 print(f'✓ Approved {count} items')
 
-            self.stats['approved'] += count
-            self.current_items = []
+            with self._lock:
+                self.stats.approved += count
+                # Keep anything a concurrent refresh added while approving
+                self.current_items = [item for item in self.current_items
+                                      if item.item_id not in approved_ids]
+                self._clamp_index()
             self.update_display()
 
         def on_batch_approve_by_agent(b):
             """Approve all items from the current agent."""
-            if not self.current_items:
-                return
-
-            current_agent = self.current_items[self.current_index].source_agent
-            items_to_approve = [item for item in self.current_items if item.source_agent == current_agent]
-            count = len(items_to_approve)
+            with self._lock:
+                if not self.current_items:
+                    return
+                current_agent = self.current_items[self.current_index].source_agent
+                ids_to_approve = [item.item_id for item in self.current_items
+                                  if item.source_agent == current_agent]
+            approved_ids = set(ids_to_approve)
+            count = len(ids_to_approve)
 
             with self.output:
                 clear_output()
                 print(f'Approving {count} items from {current_agent}...')
-                for item in items_to_approve:
-                    self.review_queue.approve_item(item.item_id)
-                    self.current_items.remove(item)
+                self._approve_items(ids_to_approve)
                 print(f'✓ Approved {count} items from {current_agent}')
 
-            self.stats['approved'] += count
+            with self._lock:
+                # Rebuild once instead of list.remove() per item (quadratic on large queues)
+                self.current_items = [item for item in self.current_items
+                                      if item.item_id not in approved_ids]
+                self._clamp_index()
+                self.stats.approved += count
             self.update_display()
 
         # Wire up event handlers
@@ -484,7 +829,7 @@ class EnhancedHITLReviewDashboard:
             self._start_auto_refresh()
 
         # Create layout
-        dashboard = widgets.VBox([
+        self._dashboard = dashboard = widgets.VBox([
             widgets.HTML('<h2>📋 Enhanced HITL Review Dashboard</h2>'),
             self.keyboard_help_html,
             widgets.HBox([job_input, self.refresh_button, self.auto_refresh_checkbox]),
@@ -508,6 +853,8 @@ class EnhancedHITLReviewDashboard:
 
     def __del__(self):
         """Cleanup on deletion."""
+        with self._update_lock:
+            self._cancel_update()
         self._stop_auto_refresh()
 
 
@@ -515,6 +862,10 @@ class EnhancedHITLReviewDashboard:
 # ENHANCED BASE AGENT WITH SMART RETRY LOGIC
 # ============================================================================
 
+# Backoff multipliers 2**attempt; later attempts reuse the last entry (the delay is capped anyway)
+_POW2 = tuple(1 << i for i in range(32))
+
+
 class EnhancedBaseAgent:
     """
     Enhanced base agent with:
@@ -524,6 +875,8 @@ class EnhancedBaseAgent:
     - Better error handling
     """
 
+    _RATE_LIMIT_RE = re.compile(r'rate limit|quota|too many requests|429', re.IGNORECASE)
+
     def __init__(self, name: str, system_prompt: str, config=None):
         self.name = name
         self.system_prompt = system_prompt
@@ -534,6 +887,8 @@ class EnhancedBaseAgent:
         self.last_request_time = 0
         self.request_count = 0
         self.logger = logging.getLogger(f'ADE.{name}')
+        # Per-agent RNG (seeded from os.urandom) so concurrent retries don't share global state
+        self._rng = random.Random()
 
     def _wait_for_rate_limit(self):
         """Implement rate limiting by waiting if necessary."""
@@ -562,11 +917,11 @@ class EnhancedBaseAgent:
             base_delay = self.config.base_retry_delay
 
         # Exponential backoff: base_delay * (2 ^ attempt)
-        delay = base_delay * (2 ** attempt)
+        delay = base_delay * _POW2[min(attempt, len(_POW2) - 1)]
 
         # Add jitter: randomize between 50% and 100% of the calculated delay
         # This prevents all clients from retrying at exactly the same time
-        jitter = delay * (0.5 + random.random() * 0.5)
+        jitter = delay * 0.5 * (1.0 + self._rng.random())
 
         # Cap maximum delay at 60 seconds
         return min(jitter, 60.0)
@@ -583,29 +938,30 @@ class EnhancedBaseAgent:
         """
         try:
             # Check if error has retry_after attribute
-            if hasattr(error, 'retry_after'):
-                return float(error.retry_after)
+            retry_after = getattr(error, 'retry_after', None)
+            if retry_after is not None:
+                return float(retry_after)
 
             # Check if error response has headers
-            if hasattr(error, 'response') and hasattr(error.response, 'headers'):
-                headers = error.response.headers
-
-                # Check for Retry-After header
-                if 'Retry-After' in headers:
-                    retry_after = headers['Retry-After']
-                    try:
-                        return float(retry_after)
-                    except ValueError:
-                        # Retry-After might be a date string, not implemented here
-                        pass
-
-                # Check for X-RateLimit-Reset header (Unix timestamp)
-                if 'X-RateLimit-Reset' in headers:
-                    reset_time = float(headers['X-RateLimit-Reset'])
-                    delay = max(0, reset_time - time.time())
-                    return delay
+            headers = getattr(getattr(error, 'response', None), 'headers', None)
+            if not hasattr(headers, 'get'):
+                return None
 
-        except Exception as e:
+            # Check for Retry-After header
+            retry_after = headers.get('Retry-After')
+            if retry_after is not None:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    # Retry-After might be a date string, not implemented here
+                    pass
+
+            # Check for X-RateLimit-Reset header (Unix timestamp)
+            reset_time = headers.get('X-RateLimit-Reset')
+            if reset_time is not None:
+                return max(0.0, float(reset_time) - time.time())
+
+        except (TypeError, ValueError) as e:
             self.logger.debug(f"Could not parse rate limit headers: {e}")
 
         return None
@@ -634,7 +990,7 @@ class EnhancedBaseAgent:
 
             except Exception as e:
                 last_error = e
-                error_msg = str(e).lower()
+                error_msg = str(e)
 
                 # Check if this is the last attempt
                 if attempt >= self.config.max_retries - 1:
@@ -642,8 +998,7 @@ class EnhancedBaseAgent:
                     raise
 
                 # Determine if this is a rate limit error
-                is_rate_limit = any(keyword in error_msg for keyword in
-                                   ['rate limit', 'quota', 'too many requests', '429'])
+                is_rate_limit = self._RATE_LIMIT_RE.search(error_msg) is not None
 
                 if is_rate_limit:
                     # Try to get retry delay from headers
@@ -692,6 +1047,216 @@ class ProcessingCheckpoint:
     checkpoint_file: Optional[str] = None
 
 
+# Checkpoint encodings, keyed by file extension
+_CHECKPOINT_EXTENSIONS = ('.msgpack.zst', '.json.zst', '.msgpack', '.json')
+
+# zstd level for checkpoint data; low levels are fast and still shrink JSON-like data several times
+ZSTD_LEVEL = 3
+
+# Pipeline stages, most advanced first; the latest checkpoint is the first one found
+_STAGE_ORDER = ('documented', 'ontology', 'analyzed', 'parsed')
+
+# Progress log entries and checkpoint headers are prefixed with their payload
+# length (4-byte, big-endian)
+_FRAME_HEADER = struct.Struct('>I')
+
+# Checkpoint metadata kept in the small header frame ahead of the bulk data
+_HEADER_FIELDS = ('job_id', 'checkpoint_time', 'stage', 'variables_processed', 'total_variables')
+
+if MSGSPEC_AVAILABLE:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+
+
+def _json_dumps(data) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(payload: bytes):
+    return orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+
+
+def _encode_into(use_msgpack: bool, data, buffer: bytearray, offset: int):
+    """Encode data into buffer at offset, replacing anything after it."""
+    if use_msgpack:
+        _MSGPACK_ENCODER.encode_into(data, buffer, offset)
+    else:
+        buffer[offset:] = _json_dumps(data)
+
+
+def _append_frame(use_msgpack: bool, data, buffer: bytearray):
+    """Append data to buffer as a length-prefixed frame."""
+    start = len(buffer)
+    body = start + _FRAME_HEADER.size
+    buffer.extend(bytes(_FRAME_HEADER.size))
+    _encode_into(use_msgpack, data, buffer, body)
+    _FRAME_HEADER.pack_into(buffer, start, len(buffer) - body)
+
+
+def _decode(payload: bytes):
+    """Decode a JSON or MessagePack document; JSON objects always start with '{'."""
+    if payload[:1] == b'{':
+        return _json_loads(payload)
+    if not MSGSPEC_AVAILABLE:
+        raise ImportError("Reading MessagePack checkpoints needs msgspec: pip install msgspec")
+    return _MSGPACK_DECODER.decode(payload)
+
+
+class _PendingWrites:
+    """
+    Progress and checkpoints a ProgressPersistenceManager has buffered but
+    not yet written.
+
+    The manager's finalizer holds this rather than the manager, so an
+    unclosed manager still gets everything written out when it is
+    garbage-collected or the interpreter exits.
+    """
+
+    def __init__(self, checkpoint_dir: str, use_msgpack: bool, logger: logging.Logger):
+        self.checkpoint_dir = checkpoint_dir
+        self.use_msgpack = use_msgpack
+        self.logger = logger
+        # job_id -> finished variables not yet appended to the progress log
+        self.progress: Dict[str, List[str]] = {}
+        # Reused for every progress frame: header followed by the payload
+        self.frame_buffer = bytearray()
+        # Progress logs stay open for appending until the job is cleared or closed
+        self.progress_files = {}
+        # Checkpoint files are encoded into this buffer; only one writer uses it at a time
+        self.write_buffer = bytearray()
+        self.write_queue = None
+        self.writer = None
+        # First background write failure, raised to the caller on the next save/flush/close
+        self.write_error = None
+
+    def start_writer(self, queue_size: int):
+        """Write checkpoints from a background thread instead of the caller's."""
+        self.write_queue = queue.Queue(maxsize=queue_size)
+        self.writer = Thread(target=self._writer_loop, name='CheckpointWriter', daemon=True)
+        self.writer.start()
+
+    def _writer_loop(self):
+        """Drain the write queue, writing only the newest data queued per file."""
+        while True:
+            batch = [self.write_queue.get()]
+            while True:
+                try:
+                    batch.append(self.write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Later saves of the same job+stage strictly supersede earlier ones
+            latest = {}
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                else:
+                    latest[item[0]] = item[1]
+
+            for path, data in latest.items():
+                try:
+                    self.write_file(path, data)
+                except Exception as e:
+                    self.logger.error(f"Failed to write checkpoint {path}: {e}")
+                    if self.write_error is None:
+                        self.write_error = e
+                else:
+                    self.logger.info(f"Saved checkpoint: {path}")
+
+            for _ in batch:
+                self.write_queue.task_done()
+            if stop:
+                return
+
+    def write_file(self, path: str, data: Dict):
+        """
+        Encode checkpoint data according to the file's extension and write it.
+
+        The file is a length-prefixed header frame with the _HEADER_FIELDS,
+        followed by the remaining (bulk) fields, so listing checkpoints never
+        has to decode the data. It goes to a temporary file that is fsynced and
+        then renamed over the checkpoint, so an interrupted write never leaves
+        a corrupt file.
+        """
+        compressed = path.endswith('.zst')
+        use_msgpack = path.endswith(('.msgpack', '.msgpack.zst'))
+        header = {field: data[field] for field in _HEADER_FIELDS}
+        body = {key: value for key, value in data.items() if key not in header}
+
+        payload = self.write_buffer
+        del payload[:]
+        _append_frame(use_msgpack, header, payload)
+        body_start = len(payload)
+        _encode_into(use_msgpack, body, payload, body_start)
+        if compressed:
+            # Compressors are not thread-safe, so each write gets its own
+            payload[body_start:] = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload[body_start:])
+
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def progress_path(self, job_id: str) -> str:
+        return f"{self.checkpoint_dir}/{job_id}_progress.log"
+
+    def encode_frame(self, data: Dict) -> bytearray:
+        """
+        Length-prefix one progress log entry in the manager's encoding.
+
+        The frame is built in a shared buffer that the next call overwrites,
+        so write it out before encoding another.
+        """
+        frame = self.frame_buffer
+        del frame[:]
+        _append_frame(self.use_msgpack, data, frame)
+        return frame
+
+    def append_progress(self, job_id: str, var_names: List[str]):
+        """Append one batch of finished variables to the job's progress log."""
+        progress_file = self.progress_files.get(job_id)
+        if progress_file is None:
+            progress_file = open(self.progress_path(job_id), 'ab')
+            self.progress_files[job_id] = progress_file
+        frame = {'checkpoint_time': datetime.now().isoformat(), 'variables': list(var_names)}
+        progress_file.write(self.encode_frame(frame))
+        progress_file.flush()
+        self.logger.debug("Recorded %d variable(s) for job %s", len(frame['variables']), job_id)
+
+    def flush_progress(self, job_id: str):
+        """Append any buffered variables for a job to its progress log."""
+        pending = self.progress.pop(job_id, None)
+        if pending:
+            self.append_progress(job_id, pending)
+
+    def close(self):
+        """Write buffered progress and queued checkpoints, then release files and the writer."""
+        for job_id in list(self.progress):
+            self.flush_progress(job_id)
+        for progress_file in self.progress_files.values():
+            progress_file.close()
+        self.progress_files.clear()
+
+        if self.writer is not None:
+            self.write_queue.put(None)
+            self.writer.join()
+            self.writer = None
+            self.write_queue = None
+
+
 class ProgressPersistenceManager:
     """
     Manages progress persistence for long-running jobs.
@@ -701,25 +1266,217 @@ class ProgressPersistenceManager:
     - Resume from last checkpoint on interruption
     - Multiple checkpoint types (after each pipeline stage)
     - Checkpoint file management
+
+    Checkpoints are written as MessagePack (``.msgpack``) when msgspec is
+    installed, which is much faster to encode and smaller than JSON; pass
+    ``use_msgpack=False`` to keep writing ``.json``. Both formats are read.
+    With zstandard installed the bulk data is also zstd-compressed (``.zst``
+    suffix, ``compress=False`` to turn off); the metadata header is not.
+
+    With ``background_writes=True`` checkpoint files are written by a
+    background thread so saving never blocks the processing loop; ``flush()``
+    waits for queued writes, and reads flush first. A failed background write
+    is raised from the next ``save_checkpoint``, ``flush()`` or ``close()``.
+    Use the manager as a context manager (or call ``close()``) to drain the
+    queue; a manager that is never closed is drained when it is
+    garbage-collected or at interpreter exit, but its write errors are then
+    only logged.
+
+    Per-variable progress is not a full checkpoint: the 'analyzed' checkpoint
+    holds the parsed/analyzed data once, and finished variables are appended
+    to ``{job_id}_progress.log`` in batches of ``flush_interval``. Loading
+    replays the log on top of that base and reports the result as the
+    'ontology' stage.
     """
 
-    def __init__(self, checkpoint_dir: str = "./checkpoints"):
+    WRITE_QUEUE_SIZE = 32
+
+    def __init__(self, checkpoint_dir: str = "./checkpoints", use_msgpack: bool = MSGSPEC_AVAILABLE,
+                 flush_interval: int = 8, background_writes: bool = False, compress: bool = ZSTD_AVAILABLE):
+        if use_msgpack and not MSGSPEC_AVAILABLE:
+            raise ImportError("MessagePack checkpoints need msgspec: pip install msgspec")
+        if compress and not ZSTD_AVAILABLE:
+            raise ImportError("Compressed checkpoints need zstandard: pip install zstandard")
         self.checkpoint_dir = checkpoint_dir
-        import os
+        self.use_msgpack = use_msgpack
+        self.extension = ('.msgpack' if use_msgpack else '.json') + ('.zst' if compress else '')
+        self.flush_interval = max(1, flush_interval)
         os.makedirs(checkpoint_dir, exist_ok=True)
         self.logger = logging.getLogger('ADE.ProgressPersistence')
 
+        self._pending = _PendingWrites(checkpoint_dir, use_msgpack, self.logger)
+        if background_writes:
+            self._pending.start_writer(self.WRITE_QUEUE_SIZE)
+        # Queued checkpoints and buffered progress are written even without close()
+        weakref.finalize(self, self._pending.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _raise_write_error(self):
+        """Re-raise the first failed background write, once."""
+        error, self._pending.write_error = self._pending.write_error, None
+        if error is not None:
+            raise error
+
+    def flush(self):
+        """Block until every queued checkpoint has been written."""
+        if self._pending.write_queue is not None:
+            self._pending.write_queue.join()
+        self._raise_write_error()
+
+    def close(self):
+        """Write any queued checkpoints and progress, then release files and the writer thread."""
+        self._pending.close()
+        self._raise_write_error()
+
+    def _read_file(self, path: str) -> Dict:
+        """Read and decode a checkpoint file written by _PendingWrites.write_file."""
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        # Files from before the header split are a single document, which
+        # never starts with a zero byte the way a frame length does
+        if content[:1] != b'\x00':
+            return _decode(content)
+
+        (length,) = _FRAME_HEADER.unpack_from(content)
+        body_start = _FRAME_HEADER.size + length
+        data = _decode(content[_FRAME_HEADER.size:body_start])
+        body = content[body_start:]
+        if path.endswith('.zst'):
+            if not ZSTD_AVAILABLE:
+                raise ImportError(f"Reading {path} needs zstandard: pip install zstandard")
+            body = zstandard.ZstdDecompressor().decompress(body)
+        data.update(_decode(body))
+        return data
+
+    def _read_header(self, path: str) -> Dict:
+        """Read only a checkpoint's metadata, without decoding its data."""
+        with open(path, 'rb') as f:
+            prefix = f.read(_FRAME_HEADER.size)
+            if prefix[:1] != b'\x00':
+                return _decode(prefix + f.read())
+            (length,) = _FRAME_HEADER.unpack(prefix)
+            return _decode(f.read(length))
+
+    def _find_checkpoint_file(self, job_id: str, stage: str) -> Optional[str]:
+        """Path of a stage checkpoint, preferring this manager's encoding."""
+        for extension in (self.extension,) + _CHECKPOINT_EXTENSIONS:
+            path = f"{self.checkpoint_dir}/{job_id}_{stage}{extension}"
+            if os.path.exists(path):
+                return path
+        return None
+
+    def append_progress(self, job_id: str, var_names: List[str]):
+        """
+        Record finished variables in the job's append-only progress log.
+
+        The whole batch shares one checkpoint_time, taken when it is written.
+
+        Args:
+            job_id: The job the variables belong to
+            var_names: Names of the variables that just finished
+        """
+        self._pending.append_progress(job_id, var_names)
+
+    def record_progress(self, job_id: str, var_name: str):
+        """Buffer a finished variable, appending a batch every flush_interval variables."""
+        pending = self._pending.progress.setdefault(job_id, [])
+        pending.append(var_name)
+        if len(pending) >= self.flush_interval:
+            self.flush_progress(job_id)
+
+    def flush_progress(self, job_id: str):
+        """Append any buffered variables for a job to its progress log."""
+        self._pending.flush_progress(job_id)
+
+    def read_progress(self, job_id: str) -> List[str]:
+        """
+        Replay the progress log for a job.
+
+        A frame cut short by a crash mid-write is ignored, so everything
+        before it is still recovered.
+
+        Returns:
+            Finished variable names in the order they were recorded
+        """
+        return self._replay_progress(job_id)[0]
+
+    def _replay_progress(self, job_id: str) -> Tuple[List[str], Optional[str]]:
+        """Finished variable names and the time of the last batch in the log."""
+        self.flush_progress(job_id)
+        try:
+            with open(self._pending.progress_path(job_id), 'rb') as f:
+                log = f.read()
+        except FileNotFoundError:
+            return [], None
+
+        processed = []
+        last_time = None
+        offset = 0
+        while offset + _FRAME_HEADER.size <= len(log):
+            (length,) = _FRAME_HEADER.unpack_from(log, offset)
+            start = offset + _FRAME_HEADER.size
+            if start + length > len(log):
+                self.logger.warning(f"Ignoring truncated progress entry for job {job_id}")
+                break
+            frame = _decode(log[start:start + length])
+            processed.extend(frame['variables'])
+            last_time = frame.get('checkpoint_time', last_time)
+            offset = start + length
+        return processed, last_time
+
+    def clear_progress(self, job_id: str):
+        """Remove a job's progress log once a full checkpoint supersedes it."""
+        # The superseding checkpoint must be on disk before the log goes
+        self.flush()
+        self._pending.progress.pop(job_id, None)
+        progress_file = self._pending.progress_files.pop(job_id, None)
+        if progress_file is not None:
+            progress_file.close()
+        try:
+            os.remove(self._pending.progress_path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def _scan(self, job_id: str = None):
+        """
+        Yield (name, path, mtime, size) for checkpoint files in any supported
+        encoding, optionally for one job, with a single stat per file.
+        """
+        prefix = f"{job_id}_" if job_id else ""
+        with os.scandir(self.checkpoint_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(_CHECKPOINT_EXTENSIONS)):
+                    continue
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                yield name, entry.path, st.st_mtime, st.st_size
+
     def save_checkpoint(self, checkpoint: ProcessingCheckpoint) -> str:
         """
         Save a processing checkpoint to disk.
 
+        With background writes the file is written asynchronously, so the
+        checkpoint's data lists must not be mutated afterwards; a failure to
+        write an earlier checkpoint is raised here.
+
         Args:
             checkpoint: The checkpoint data to save
 
         Returns:
             Path to the saved checkpoint file
         """
-        checkpoint_file = f"{self.checkpoint_dir}/{checkpoint.job_id}_{checkpoint.stage}.json"
+        self._raise_write_error()
+
+        checkpoint_file = f"{self.checkpoint_dir}/{checkpoint.job_id}_{checkpoint.stage}{self.extension}"
 
         checkpoint_data = {
             'job_id': checkpoint.job_id,
@@ -732,11 +1489,15 @@ class ProgressPersistenceManager:
             'processed_variables': checkpoint.processed_variables or []
         }
 
-        with open(checkpoint_file, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2)
-
-        self.logger.info(f"Saved checkpoint: {checkpoint_file}")
-        print(f"💾 Checkpoint saved: {checkpoint.stage} ({checkpoint.variables_processed}/{checkpoint.total_variables} vars)")
+        progress = f"{checkpoint.stage} ({checkpoint.variables_processed}/{checkpoint.total_variables} vars)"
+        if self._pending.write_queue is not None:
+            # The writer thread logs the save once the file is on disk
+            self._pending.write_queue.put((checkpoint_file, checkpoint_data))
+            print(f"💾 Checkpoint queued: {progress}")
+        else:
+            self._pending.write_file(checkpoint_file, checkpoint_data)
+            self.logger.info(f"Saved checkpoint: {checkpoint_file}")
+            print(f"💾 Checkpoint saved: {progress}")
 
         return checkpoint_file
 
@@ -746,32 +1507,32 @@ class ProgressPersistenceManager:
 
         Args:
             job_id: The job ID to load
-            stage: Specific stage to load, or None for latest
+            stage: Specific stage to load, or None for the most advanced stage
 
         Returns:
             ProcessingCheckpoint if found, None otherwise
         """
-        import os
-        import glob
+        self.flush()
 
         if stage:
-            checkpoint_file = f"{self.checkpoint_dir}/{job_id}_{stage}.json"
-            if not os.path.exists(checkpoint_file):
+            checkpoint_file = self._find_checkpoint_file(job_id, stage)
+            if checkpoint_file is None and stage == 'ontology':
+                # Ontology progress is the analyzed base plus the progress log
+                checkpoint_file = self._find_checkpoint_file(job_id, 'analyzed')
+            if checkpoint_file is None:
                 return None
         else:
-            # Find latest checkpoint for this job
-            pattern = f"{self.checkpoint_dir}/{job_id}_*.json"
-            checkpoint_files = glob.glob(pattern)
-
-            if not checkpoint_files:
+            # The most advanced stage saved for this job
+            checkpoint_file = None
+            for candidate in _STAGE_ORDER:
+                checkpoint_file = self._find_checkpoint_file(job_id, candidate)
+                if checkpoint_file:
+                    break
+            if checkpoint_file is None:
                 return None
 
-            # Get most recent file
-            checkpoint_file = max(checkpoint_files, key=os.path.getmtime)
-
         try:
-            with open(checkpoint_file, 'r') as f:
-                data = json.load(f)
+            data = self._read_file(checkpoint_file)
 
             checkpoint = ProcessingCheckpoint(
                 job_id=data['job_id'],
@@ -785,6 +1546,14 @@ class ProgressPersistenceManager:
                 checkpoint_file=checkpoint_file
             )
 
+            if checkpoint.stage == 'analyzed':
+                processed, last_time = self._replay_progress(checkpoint.job_id)
+                if processed:
+                    checkpoint.stage = 'ontology'
+                    checkpoint.checkpoint_time = last_time or checkpoint.checkpoint_time
+                    checkpoint.processed_variables = processed
+                    checkpoint.variables_processed = len(processed)
+
             self.logger.info(f"Loaded checkpoint: {checkpoint_file}")
             print(f"📂 Checkpoint loaded: {checkpoint.stage} ({checkpoint.variables_processed}/{checkpoint.total_variables} vars)")
 
@@ -804,22 +1573,12 @@ class ProgressPersistenceManager:
         Returns:
             List of checkpoint info dictionaries
         """
-        import os
-        import glob
-
-        pattern = f"{self.checkpoint_dir}/"
-        if job_id:
-            pattern += f"{job_id}_*.json"
-        else:
-            pattern += "*.json"
-
-        checkpoint_files = glob.glob(pattern)
+        self.flush()
         checkpoints = []
 
-        for file in checkpoint_files:
+        for _, file, _, size in self._scan(job_id):
             try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
+                data = self._read_header(file)
 
                 checkpoints.append({
                     'file': file,
@@ -827,7 +1586,7 @@ class ProgressPersistenceManager:
                     'stage': data['stage'],
                     'checkpoint_time': data['checkpoint_time'],
                     'progress': f"{data['variables_processed']}/{data['total_variables']}",
-                    'size_kb': os.path.getsize(file) / 1024
+                    'size_kb': size / 1024
                 })
             except Exception as e:
                 self.logger.warning(f"Could not read checkpoint {file}: {e}")
@@ -842,20 +1601,17 @@ class ProgressPersistenceManager:
             job_id: Job ID to clean up
             keep_latest: Number of latest checkpoints to keep
         """
-        import os
-        import glob
-
-        pattern = f"{self.checkpoint_dir}/{job_id}_*.json"
-        checkpoint_files = glob.glob(pattern)
+        self.flush()
+        checkpoint_files = list(self._scan(job_id))
 
         if len(checkpoint_files) <= keep_latest:
             return
 
         # Sort by modification time
-        checkpoint_files.sort(key=os.path.getmtime, reverse=True)
+        checkpoint_files.sort(key=lambda f: f[2], reverse=True)
 
         # Remove old checkpoints
-        for file in checkpoint_files[keep_latest:]:
+        for _, file, _, _ in checkpoint_files[keep_latest:]:
             try:
                 os.remove(file)
                 self.logger.info(f"Removed old checkpoint: {file}")
@@ -874,6 +1630,8 @@ def add_progress_persistence_to_orchestrator(orchestrator_class):
     Usage in notebook:
         This adds new methods to the Orchestrator without modifying the original class.
     """
+    logger = logging.getLogger('ADE.Orchestrator')
+    progress_report_every = 10
 
     def process_with_checkpoints(self, source_data: str, source_file: str = "input.csv",
                                  auto_approve: bool = False, resume_from_checkpoint: bool = True) -> str:
@@ -889,171 +1647,169 @@ def add_progress_persistence_to_orchestrator(orchestrator_class):
         Returns:
             job_id: The ID of the created job
         """
-        persistence_mgr = ProgressPersistenceManager()
-
-        # Check for existing checkpoint if resume is enabled
-        checkpoint = None
-        job_id = None
-
-        if resume_from_checkpoint:
-            # Try to find checkpoint for this source file
-            # In a real implementation, we'd need a way to map source_file to job_id
-            checkpoints = persistence_mgr.list_checkpoints()
-            if checkpoints:
-                print(f"📂 Found {len(checkpoints)} existing checkpoint(s)")
-                print("   Use the latest checkpoint? (This is automatic for demo)")
-                latest = checkpoints[0]
-                checkpoint = persistence_mgr.load_checkpoint(latest['job_id'])
-                if checkpoint:
-                    job_id = checkpoint.job_id
-
-        # Create new job if no checkpoint found
-        if not job_id:
-            job_id = self.create_job(source_file)
-            print(f"\n{'='*60}")
-            print(f"Processing Job: {job_id} (with checkpoints)")
-            print(f"{'='*60}")
-        else:
-            print(f"\n{'='*60}")
-            print(f"Resuming Job: {job_id} from checkpoint")
-            print(f"   Stage: {checkpoint.stage}")
-            print(f"   Progress: {checkpoint.variables_processed}/{checkpoint.total_variables}")
-            print(f"{'='*60}")
-
-        # Step 1: Parse data (or resume from checkpoint)
-        if checkpoint and checkpoint.stage in ['analyzed', 'ontology', 'documented']:
-            print("\n📊 Step 1: Parsing Data... (loaded from checkpoint)")
-            parsed_data = checkpoint.parsed_data
-        else:
-            print("\n📊 Step 1: Parsing Data...")
-            parsed_data = self.data_parser.parse_csv(source_data)
-            print(f"   ✓ Parsed {len(parsed_data)} variables")
-
-            # Save checkpoint after parsing
-            checkpoint_obj = ProcessingCheckpoint(
-                job_id=job_id,
-                checkpoint_time=datetime.now().isoformat(),
-                stage='parsed',
-                variables_processed=0,
-                total_variables=len(parsed_data),
-                parsed_data=parsed_data
-            )
-            persistence_mgr.save_checkpoint(checkpoint_obj)
-
-        # Step 2: Technical analysis (or resume from checkpoint)
-        if checkpoint and checkpoint.stage in ['ontology', 'documented']:
-            print("\n🔬 Step 2: Technical Analysis... (loaded from checkpoint)")
-            analyzed_data = checkpoint.analyzed_data
-        else:
-            print("\n🔬 Step 2: Technical Analysis...")
-            analyzed_data = self.technical_analyzer.analyze(parsed_data)
-            print(f"   ✓ Analyzed {len(analyzed_data)} variables")
-
-            # Save checkpoint after analysis
-            checkpoint_obj = ProcessingCheckpoint(
-                job_id=job_id,
-                checkpoint_time=datetime.now().isoformat(),
-                stage='analyzed',
-                variables_processed=0,
-                total_variables=len(analyzed_data),
-                parsed_data=parsed_data,
-                analyzed_data=analyzed_data
-            )
-            persistence_mgr.save_checkpoint(checkpoint_obj)
-
-        # Step 3: Ontology mapping and documentation (with per-variable checkpoints)
-        print("\n🏥 Step 3: Ontology Mapping & Documentation...")
-
-        # Determine which variables have already been processed
-        processed_vars = set(checkpoint.processed_variables if checkpoint else [])
-
-        for i, var_data in enumerate(analyzed_data, 1):
-            var_name = var_data.get('variable_name', var_data.get('original_name'))
-
-            # Skip if already processed
-            if var_name in processed_vars:
-                print(f"   Skipping {i}/{len(analyzed_data)}: {var_name} (already processed)")
-                continue
-
-            print(f"   Processing {i}/{len(analyzed_data)}: {var_name}")
-
-            try:
-                # Map to ontologies
-                ontology_result = self.domain_ontology.map_ontologies(var_data)
-                enriched_data = {**var_data, **ontology_result}
-
-                # Generate plain language documentation
-                documentation = self.plain_language.document_variable(enriched_data)
-
-                # Add to review queue
-                item_id = self.review_queue.add_item(
-                    job_id=job_id,
-                    source_agent="PlainLanguageAgent",
-                    source_data=json.dumps(enriched_data),
-                    generated_content=documentation
-                )
-
-                if auto_approve:
-                    self.review_queue.approve_item(item_id)
+        with ProgressPersistenceManager(background_writes=True) as persistence_mgr:
+
+            # Check for existing checkpoint if resume is enabled
+            checkpoint = None
+            job_id = None
+
+            if resume_from_checkpoint:
+                # Try to find checkpoint for this source file
+                # In a real implementation, we'd need a way to map source_file to job_id
+                checkpoints = persistence_mgr.list_checkpoints()
+                if checkpoints:
+                    print(f"📂 Found {len(checkpoints)} existing checkpoint(s)")
+                    print("   Use the latest checkpoint? (This is automatic for demo)")
+                    latest = checkpoints[0]
+                    checkpoint = persistence_mgr.load_checkpoint(latest['job_id'])
+                    if checkpoint:
+                        job_id = checkpoint.job_id
+
+            # Create new job if no checkpoint found
+            if not job_id:
+                job_id = self.create_job(source_file)
+                print(f"\n{'='*60}")
+                print(f"Processing Job: {job_id} (with checkpoints)")
+                print(f"{'='*60}")
+            else:
+                print(f"\n{'='*60}")
+                print(f"Resuming Job: {job_id} from checkpoint")
+                print(f"   Stage: {checkpoint.stage}")
+                print(f"   Progress: {checkpoint.variables_processed}/{checkpoint.total_variables}")
+                print(f"{'='*60}")
+
+            # Step 1: Parse data (or resume from checkpoint)
+            if checkpoint and checkpoint.stage in ['analyzed', 'ontology', 'documented']:
+                print("\n📊 Step 1: Parsing Data... (loaded from checkpoint)")
+                parsed_data = checkpoint.parsed_data
+            else:
+                print("\n📊 Step 1: Parsing Data...")
+                parsed_data = self.data_parser.parse_csv(source_data)
+                print(f"   ✓ Parsed {len(parsed_data)} variables")
 
-                # Save checkpoint after each variable
-                processed_vars.add(var_name)
+                # Save checkpoint after parsing
                 checkpoint_obj = ProcessingCheckpoint(
                     job_id=job_id,
                     checkpoint_time=datetime.now().isoformat(),
-                    stage='ontology',
-                    variables_processed=len(processed_vars),
-                    total_variables=len(analyzed_data),
-                    parsed_data=parsed_data,
-                    analyzed_data=analyzed_data,
-                    processed_variables=list(processed_vars)
+                    stage='parsed',
+                    variables_processed=0,
+                    total_variables=len(parsed_data),
+                    parsed_data=parsed_data
                 )
                 persistence_mgr.save_checkpoint(checkpoint_obj)
 
-            except Exception as e:
-                print(f"   ❌ Error processing {var_name}: {str(e)[:100]}")
-                print(f"   💾 Progress saved. You can resume from this point.")
-                # Save checkpoint before raising
+            # Step 2: Technical analysis (or resume from checkpoint)
+            if checkpoint and checkpoint.stage in ['ontology', 'documented']:
+                print("\n🔬 Step 2: Technical Analysis... (loaded from checkpoint)")
+                analyzed_data = checkpoint.analyzed_data
+            else:
+                print("\n🔬 Step 2: Technical Analysis...")
+                analyzed_data = self.technical_analyzer.analyze(parsed_data)
+                print(f"   ✓ Analyzed {len(analyzed_data)} variables")
+
+                # Save checkpoint after analysis
                 checkpoint_obj = ProcessingCheckpoint(
                     job_id=job_id,
                     checkpoint_time=datetime.now().isoformat(),
-                    stage='ontology',
-                    variables_processed=len(processed_vars),
+                    stage='analyzed',
+                    variables_processed=0,
                     total_variables=len(analyzed_data),
                     parsed_data=parsed_data,
-                    analyzed_data=analyzed_data,
-                    processed_variables=list(processed_vars)
+                    analyzed_data=analyzed_data
                 )
                 persistence_mgr.save_checkpoint(checkpoint_obj)
-                raise
 
-        # Update job status
-        status = 'Completed' if auto_approve else 'Pending Review'
-        self.db.execute_update(
-            "UPDATE Jobs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE job_id = ?",
-            (status, job_id)
-        )
+            # Step 3: Ontology mapping and documentation (with per-variable checkpoints)
+            print("\n🏥 Step 3: Ontology Mapping & Documentation...")
 
-        # Save final checkpoint
-        checkpoint_obj = ProcessingCheckpoint(
-            job_id=job_id,
-            checkpoint_time=datetime.now().isoformat(),
-            stage='documented',
-            variables_processed=len(analyzed_data),
-            total_variables=len(analyzed_data),
-            parsed_data=parsed_data,
-            analyzed_data=analyzed_data,
-            processed_variables=list(processed_vars)
-        )
-        persistence_mgr.save_checkpoint(checkpoint_obj)
+            # Determine which variables have already been processed
+            var_names = [v.get('variable_name', v.get('original_name')) for v in analyzed_data]
+            processed_vars = set(checkpoint.processed_variables if checkpoint else [])
+            remaining = [(name, v) for name, v in zip(var_names, analyzed_data) if name not in processed_vars]
+
+            skipped = len(analyzed_data) - len(remaining)
+            if skipped:
+                print(f"   Skipping {skipped}/{len(analyzed_data)} variables (already processed)")
+
+            # One dict reused for each variable's enriched data; it is serialized
+            # before the next iteration overwrites it
+            enriched_data = {}
+
+            # Bound once outside the loop
+            total = len(analyzed_data)
+            map_ontologies = self.domain_ontology.map_ontologies
+            document_variable = self.plain_language.document_variable
+            add_item = self.review_queue.add_item
+            approve_item = self.review_queue.approve_item
+            record_progress = persistence_mgr.record_progress
+            dumps = json.dumps
+
+            try:
+                for i, (var_name, var_data) in enumerate(remaining, skipped + 1):
+                    logger.debug("Processing %d/%d: %s", i, total, var_name)
+
+                    try:
+                        # Map to ontologies
+                        ontology_result = map_ontologies(var_data)
+                        enriched_data.clear()
+                        enriched_data.update(var_data)
+                        enriched_data.update(ontology_result)
+
+                        # Generate plain language documentation
+                        documentation = document_variable(enriched_data)
+
+                        # Add to review queue
+                        item_id = add_item(
+                            job_id=job_id,
+                            source_agent="PlainLanguageAgent",
+                            source_data=dumps(enriched_data),
+                            generated_content=documentation
+                        )
+
+                        if auto_approve:
+                            approve_item(item_id)
+
+                        # Record progress after each variable (the analyzed checkpoint holds the data)
+                        record_progress(job_id, var_name)
+                        if i % progress_report_every == 0 or i == total:
+                            print(f"   ✓ {i}/{total} variables documented")
+
+                    except Exception as e:
+                        print(f"   ❌ Error processing {var_name}: {str(e)[:100]}")
+                        print(f"   💾 Progress saved. You can resume from this point.")
+                        raise
+            finally:
+                # Persist whatever is still buffered, including when a variable fails
+                persistence_mgr.flush_progress(job_id)
+
+            # Update job status
+            status = 'Completed' if auto_approve else 'Pending Review'
+            self.db.execute_update(
+                "UPDATE Jobs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE job_id = ?",
+                (status, job_id)
+            )
+
+            # Save final checkpoint
+            checkpoint_obj = ProcessingCheckpoint(
+                job_id=job_id,
+                checkpoint_time=datetime.now().isoformat(),
+                stage='documented',
+                variables_processed=len(analyzed_data),
+                total_variables=len(analyzed_data),
+                parsed_data=parsed_data,
+                analyzed_data=analyzed_data,
+                processed_variables=var_names
+            )
+            persistence_mgr.save_checkpoint(checkpoint_obj)
+            persistence_mgr.clear_progress(job_id)
 
-        # Cleanup old checkpoints (keep last 3)
-        persistence_mgr.cleanup_old_checkpoints(job_id, keep_latest=3)
+            # Cleanup old checkpoints (keep last 3)
+            persistence_mgr.cleanup_old_checkpoints(job_id, keep_latest=3)
 
-        print(f"\n✓ Processing complete! Job status: {status}")
-        print(f"   Checkpoints saved in: {persistence_mgr.checkpoint_dir}")
+            print(f"\n✓ Processing complete! Job status: {status}")
+            print(f"   Checkpoints saved in: {persistence_mgr.checkpoint_dir}")
 
-        return job_id
+            return job_id
 
     # Add the method to the class
     orchestrator_class.process_with_checkpoints = process_with_checkpoints
@@ -17,27 +17,141 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
-import argparse
-import subprocess
-from pathlib import Path
+import shutil
+import functools
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+CONFIG_FILENAME = '.agent_engine_config.json'
+DEFAULT_AGENT_PATH = 'healthcare_agent_deploy'
+
+# Agent files the validator reads; their mtimes key cached validation results
+_VALIDATED_FILES = ('agent.py', CONFIG_FILENAME, 'requirements.txt', 'README.md', '.gcloudignore')
+
+# Successful validations for this process, keyed by _validation_signature()
+_VALIDATION_CACHE: Dict[tuple, 'ValidationResult'] = {}
+
+# Horizontal rule framing headers and the deploy confirmation
+_RULE = '=' * 70
+
+# Fixed leading arguments of the adk commands
+_DEPLOY_CMD_PREFIX = ('adk', 'deploy', 'agent_engine')
+_LIST_CMD_PREFIX = ('adk', 'list', 'agent_engines')
+
+# Kubernetes-style memory quantities ("4Gi", "512Mi", "8G"); a bare number means Gi
+_MEM_RE = re.compile(r'^\s*([\d.]+)\s*([KMGT]i?)?B?\s*$')
+_UNIT_GB = {
+    'Ki': 1 / 1024 ** 2, 'Mi': 1 / 1024, 'Gi': 1.0, 'Ti': 1024.0,
+    'K': 1e3 / 1024 ** 3, 'M': 1e6 / 1024 ** 3, 'G': 1e9 / 1024 ** 3, 'T': 1e12 / 1024 ** 3,
+}
+
+
+# Cost estimate block printed after a successful validation
+_COST_TEMPLATE = (
+    "\n💰 COST ESTIMATE:\n"
+    "  • Always-on cost: ${always_on_monthly:.2f}/month\n"
+    "  • Per instance-hour: ${per_instance_hour:.4f}\n"
+    "  • Max cost (all instances 24/7): ${max_monthly:.2f}/month\n"
+    "\n  Note: Actual costs depend on usage patterns.\n"
+    "  With auto-scaling (min_instances=0), you only pay when active.\n\n"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config(path: str, mtime_ns: int) -> Dict:
+    """Parse a config file; mtime_ns is part of the cache key so edits are re-read."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+DEFAULT_REGION = 'us-central1'
+
+
+@functools.lru_cache(maxsize=1)
+def _gcp_env() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Project ID and region from the environment, resolved once per process.
+
+    GOOGLE_CLOUD_PROJECT / GOOGLE_CLOUD_LOCATION take precedence over
+    PROJECT_ID / REGION. The region is None when unset; callers fall back to
+    DEFAULT_REGION. Call _gcp_env.cache_clear() after changing the variables.
+    """
+    project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('PROJECT_ID')
+    region = os.environ.get('GOOGLE_CLOUD_LOCATION') or os.environ.get('REGION')
+    return project_id, region
+
+
+def _validation_signature(agent_path: str) -> Optional[tuple]:
+    """
+    Identify the inputs validation depends on: the agent directory, the
+    mtime (or absence) of each file the validator reads, and the
+    project/region from the environment. None if the path is not a directory.
+    """
+    if not os.path.isdir(agent_path):
+        return None
+    mtimes = []
+    for name in _VALIDATED_FILES:
+        try:
+            mtimes.append(os.stat(os.path.join(agent_path, name)).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return (os.path.abspath(agent_path), tuple(mtimes), _gcp_env())
+
+
+@functools.lru_cache(maxsize=1)
+def _find_adk() -> Optional[str]:
+    """Absolute path of the adk CLI, resolved from PATH once per process."""
+    return shutil.which('adk')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_memory_gb(memory: str) -> float:
+    """Convert a memory quantity to (binary) gigabytes, e.g. '512Mi' -> 0.5."""
+    match = _MEM_RE.match(memory)
+    if not match:
+        raise ValueError(f"Invalid memory value: {memory}")
+    return float(match.group(1)) * _UNIT_GB[match.group(2) or 'Gi']
+
+
+def load_config(path: str) -> Dict:
+    """
+    Load a JSON config file, reusing the parsed result while the file is unchanged.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    return _load_config(path, os.stat(path).st_mtime_ns)
 
 
 # ============================================================================
 # DEPLOYMENT VALIDATION
 # ============================================================================
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Result of validation checks."""
     is_valid: bool
     errors: List[str]
     warnings: List[str]
     info: List[str]
+    # Config file contents as parsed during validation (None if unreadable)
+    parsed_config: Optional[Dict] = None
 
 
 class DeploymentValidator:
@@ -54,33 +168,41 @@ class DeploymentValidator:
             errors.append(f"Agent path does not exist: {agent_path}")
             return ValidationResult(False, errors, warnings, info)
 
-        # Validate required files
-        result = self._validate_required_files(agent_path)
-        errors.extend(result[0])
-        warnings.extend(result[1])
-        info.extend(result[2])
-
-        # Validate configuration
-        config_result = self._validate_config(agent_path)
-        errors.extend(config_result[0])
-        warnings.extend(config_result[1])
-        info.extend(config_result[2])
-
-        # Validate agent code
-        agent_result = self._validate_agent_code(agent_path)
-        errors.extend(agent_result[0])
-        warnings.extend(agent_result[1])
-        info.extend(agent_result[2])
-
-        # Check environment
-        env_result = self._check_environment()
+        from concurrent.futures import ThreadPoolExecutor
+
+        # The environment check waits on the gcloud/adk CLIs; run it in the
+        # background while the agent directory is checked
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            env_future = pool.submit(self._check_environment)
+
+            # Validate required files
+            result = self._validate_required_files(agent_path)
+            errors.extend(result[0])
+            warnings.extend(result[1])
+            info.extend(result[2])
+
+            # Validate configuration
+            config_result = self._validate_config(agent_path)
+            errors.extend(config_result[0])
+            warnings.extend(config_result[1])
+            info.extend(config_result[2])
+            parsed_config = config_result[3]
+
+            # Validate agent code
+            agent_result = self._validate_agent_code(agent_path)
+            errors.extend(agent_result[0])
+            warnings.extend(agent_result[1])
+            info.extend(agent_result[2])
+
+            # Check environment
+            env_result = env_future.result()
         errors.extend(env_result[0])
         warnings.extend(env_result[1])
         info.extend(env_result[2])
 
         is_valid = len(errors) == 0
 
-        return ValidationResult(is_valid, errors, warnings, info)
+        return ValidationResult(is_valid, errors, warnings, info, parsed_config)
 
     def _validate_required_files(self, agent_path: str) -> Tuple[List, List, List]:
         """Check for required files."""
@@ -88,7 +210,7 @@ class DeploymentValidator:
 
         required = {
             'agent.py': 'Main agent code',
-            '.agent_engine_config.json': 'Configuration file',
+            CONFIG_FILENAME: 'Configuration file',
             'requirements.txt': 'Python dependencies'
         }
 
@@ -111,18 +233,18 @@ class DeploymentValidator:
 
         return errors, warnings, info
 
-    def _validate_config(self, agent_path: str) -> Tuple[List, List, List]:
-        """Validate configuration file."""
+    def _validate_config(self, agent_path: str) -> Tuple[List, List, List, Optional[Dict]]:
+        """Validate configuration file, also returning the parsed config."""
         errors, warnings, info = [], [], []
+        config = None
 
-        config_path = os.path.join(agent_path, '.agent_engine_config.json')
+        config_path = os.path.join(agent_path, CONFIG_FILENAME)
 
         if not os.path.exists(config_path):
-            return errors, warnings, info
+            return errors, warnings, info, config
 
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = load_config(config_path)
 
             # Validate min_instances
             min_inst = config.get('min_instances')
@@ -201,7 +323,7 @@ class DeploymentValidator:
         except Exception as e:
             errors.append(f"Error reading config: {e}")
 
-        return errors, warnings, info
+        return errors, warnings, info, config
 
     def _validate_agent_code(self, agent_path: str) -> Tuple[List, List, List]:
         """Validate agent.py code."""
@@ -254,16 +376,17 @@ class DeploymentValidator:
 
     def _check_environment(self) -> Tuple[List, List, List]:
         """Check environment setup."""
+        import subprocess
+
         errors, warnings, info = [], [], []
 
         # Check required env vars
-        project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('PROJECT_ID')
+        project_id, region = _gcp_env()
         if not project_id:
             errors.append("Missing environment variable: GOOGLE_CLOUD_PROJECT or PROJECT_ID")
         else:
             info.append(f"✓ Project ID: {project_id}")
 
-        region = os.environ.get('GOOGLE_CLOUD_LOCATION') or os.environ.get('REGION')
         if not region:
             warnings.append("Missing GOOGLE_CLOUD_LOCATION or REGION (will use default)")
         else:
@@ -281,14 +404,15 @@ class DeploymentValidator:
             errors.append("gcloud CLI not found - install Google Cloud SDK")
 
         # Check ADK CLI
-        try:
-            result = subprocess.run(['adk', '--version'], capture_output=True, text=True)
+        adk = _find_adk()
+        if adk is None:
+            errors.append("adk CLI not found - install with: pip install google-genai-adk")
+        else:
+            result = subprocess.run([adk, '--version'], capture_output=True, text=True)
             if result.returncode == 0:
                 info.append("✓ ADK CLI installed")
             else:
                 warnings.append("ADK CLI found but may not be working")
-        except FileNotFoundError:
-            errors.append("adk CLI not found - install with: pip install google-genai-adk")
 
         return errors, warnings, info
 
@@ -305,33 +429,64 @@ class CostEstimator:
     COST_PER_GB_HOUR = 0.0058     # USD
     HOURS_PER_MONTH = 730
 
+    # Cost of one vCPU / one GB running for a whole month
+    _MONTHLY_VCPU = COST_PER_VCPU_HOUR * HOURS_PER_MONTH
+    _MONTHLY_GB = COST_PER_GB_HOUR * HOURS_PER_MONTH
+
+    @staticmethod
+    def _resources(config: Dict) -> Tuple[float, float]:
+        """CPU count and memory in GB for a config, with the deployment defaults."""
+        resources = config.get('resource_limits', {})
+        cpu = float(resources.get('cpu', '2'))
+        memory_gb = _parse_memory_gb(resources.get('memory', '4Gi'))
+        return cpu, memory_gb
+
     def estimate_monthly_cost(self, config: Dict) -> Dict[str, float]:
         """Estimate monthly cost based on configuration."""
         min_instances = config.get('min_instances', 0)
         max_instances = config.get('max_instances', 1)
-        resources = config.get('resource_limits', {})
+        cpu, memory_gb = self._resources(config)
 
-        cpu = float(resources.get('cpu', '2'))
-        memory_str = resources.get('memory', '4Gi')
-        memory_gb = float(memory_str.replace('Gi', ''))
+        # Cost of one instance running all month
+        instance_month = cpu * self._MONTHLY_VCPU + memory_gb * self._MONTHLY_GB
 
         # Always-on costs (min instances)
-        always_on_cpu_cost = min_instances * cpu * self.COST_PER_VCPU_HOUR * self.HOURS_PER_MONTH
-        always_on_mem_cost = min_instances * memory_gb * self.COST_PER_GB_HOUR * self.HOURS_PER_MONTH
-        always_on_total = always_on_cpu_cost + always_on_mem_cost
+        always_on = round(min_instances * instance_month, 2)
+        # Estimate max cost (if all instances run 24/7); same as always-on for fixed-size deployments
+        if max_instances == min_instances:
+            max_total = always_on
+        else:
+            max_total = round(max_instances * instance_month, 2)
 
-        # Per-hour costs for scaling
-        per_instance_hour = cpu * self.COST_PER_VCPU_HOUR + memory_gb * self.COST_PER_GB_HOUR
+        return {
+            'always_on_monthly': always_on,
+            # Per-hour costs for scaling
+            'per_instance_hour': round(instance_month / self.HOURS_PER_MONTH, 4),
+            'max_monthly': max_total,
+            'currency': 'USD'
+        }
 
-        # Estimate max cost (if all instances run 24/7)
-        max_cpu_cost = max_instances * cpu * self.COST_PER_VCPU_HOUR * self.HOURS_PER_MONTH
-        max_mem_cost = max_instances * memory_gb * self.COST_PER_GB_HOUR * self.HOURS_PER_MONTH
-        max_total = max_cpu_cost + max_mem_cost
+    def estimate_monthly_costs_batch(self, configs: List[Dict]) -> Dict:
+        """
+        Estimate costs for many candidate configurations in one vectorized pass.
+
+        Returns the same keys as estimate_monthly_cost, with a NumPy array of
+        values (one per config, in order) for each cost.
+        """
+        import numpy as np
+
+        count = len(configs)
+        resources = np.array([self._resources(c) for c in configs], dtype=np.float64).reshape(count, 2)
+        cpu, memory_gb = resources[:, 0], resources[:, 1]
+        min_instances = np.fromiter((c.get('min_instances', 0) for c in configs), dtype=np.float64, count=count)
+        max_instances = np.fromiter((c.get('max_instances', 1) for c in configs), dtype=np.float64, count=count)
+
+        instance_month = cpu * self._MONTHLY_VCPU + memory_gb * self._MONTHLY_GB
 
         return {
-            'always_on_monthly': round(always_on_total, 2),
-            'per_instance_hour': round(per_instance_hour, 4),
-            'max_monthly': round(max_total, 2),
+            'always_on_monthly': np.round(min_instances * instance_month, 2),
+            'per_instance_hour': np.round(instance_month / self.HOURS_PER_MONTH, 4),
+            'max_monthly': np.round(max_instances * instance_month, 2),
             'currency': 'USD'
         }
 
@@ -343,6 +498,9 @@ class CostEstimator:
 class DeploymentManager:
     """Manages deployment process."""
 
+    # Lines of deploy output kept for the error summary
+    OUTPUT_TAIL_LINES = 200
+
     def __init__(self, agent_path: str, verbose: bool = True):
         self.agent_path = agent_path
         self.verbose = verbose
@@ -351,107 +509,133 @@ class DeploymentManager:
 
     def print_header(self, text: str):
         """Print formatted header."""
-        print(f"\n{'=' * 70}")
-        print(f"  {text}")
-        print(f"{'=' * 70}\n")
+        sys.stdout.write(f"\n{_RULE}\n  {text}\n{_RULE}\n\n")
 
     def print_result(self, result: ValidationResult):
-        """Print validation results."""
-        if result.errors:
-            print(f"\n❌ ERRORS ({len(result.errors)}):")
-            for error in result.errors:
-                print(f"  • {error}")
-
-        if result.warnings:
-            print(f"\n⚠️  WARNINGS ({len(result.warnings)}):")
-            for warning in result.warnings:
-                print(f"  • {warning}")
-
-        if result.info:
-            print(f"\n✓ CHECKS PASSED ({len(result.info)}):")
-            for info in result.info:
-                print(f"  • {info}")
+        """Print validation results, one write per section."""
+        sections = (
+            ('❌ ERRORS', result.errors),
+            ('⚠️  WARNINGS', result.warnings),
+            ('✓ CHECKS PASSED', result.info),
+        )
+        for title, items in sections:
+            if items:
+                sys.stdout.write(f"\n{title} ({len(items)}):\n" + ''.join(f"  • {item}\n" for item in items))
 
     def validate(self) -> bool:
         """Run validation checks."""
+        return self._validate()[0]
+
+    def _validate(self) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        Run validation checks, returning (is_valid, parsed_config, config_path).
+
+        config_path is the absolute path of the validated config file; it and
+        the parsed config are None when validation fails.
+        """
         self.print_header("🔍 Pre-Flight Validation")
 
-        result = self.validator.validate_all(self.agent_path)
+        # Shared by every manager, so a validate() followed by a deploy()
+        # through a new manager reuses the result
+        signature = _validation_signature(self.agent_path)
+        result = _VALIDATION_CACHE.get(signature) if signature else None
+        if result is None:
+            result = self.validator.validate_all(self.agent_path)
+            # Only successes are reused; failures are re-checked after a fix
+            if signature and result.is_valid:
+                _VALIDATION_CACHE[signature] = result
         self.print_result(result)
 
         if result.is_valid:
             print("\n✓ All checks passed! Ready to deploy.\n")
 
-            # Show cost estimate
+            # Show cost estimate from the config validation already parsed
             try:
-                config_path = os.path.join(self.agent_path, '.agent_engine_config.json')
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-
-                costs = self.cost_estimator.estimate_monthly_cost(config)
-
-                print("\n💰 COST ESTIMATE:")
-                print(f"  • Always-on cost: ${costs['always_on_monthly']:.2f}/month")
-                print(f"  • Per instance-hour: ${costs['per_instance_hour']:.4f}")
-                print(f"  • Max cost (all instances 24/7): ${costs['max_monthly']:.2f}/month")
-                print(f"\n  Note: Actual costs depend on usage patterns.")
-                print(f"  With auto-scaling (min_instances=0), you only pay when active.\n")
+                costs = self.cost_estimator.estimate_monthly_cost(result.parsed_config)
+                sys.stdout.write(_COST_TEMPLATE.format_map(costs))
 
             except Exception as e:
                 print(f"\n⚠️  Could not estimate costs: {e}\n")
 
-            return True
+            config_path = os.path.abspath(os.path.join(self.agent_path, CONFIG_FILENAME))
+            return True, result.parsed_config, config_path
         else:
             print("\n❌ Validation failed. Fix errors above before deploying.\n")
-            return False
+            return False, None, None
+
+    def deploy(self, dry_run: bool = False, yes: bool = False) -> bool:
+        """
+        Deploy agent to Vertex AI.
+
+        Asks for confirmation unless yes is set; without a terminal to ask on,
+        the deployment is cancelled rather than waiting on input().
+        """
+        import subprocess
 
-    def deploy(self, dry_run: bool = False) -> bool:
-        """Deploy agent to Vertex AI."""
-        # First validate
-        if not self.validate():
+        # First validate; the config path comes from the validated result
+        is_valid, _, config_file = self._validate()
+        if not is_valid:
             return False
 
         # Confirm deployment
-        if not dry_run:
-            print("\n" + "=" * 70)
+        if not dry_run and not yes:
+            if not sys.stdin.isatty():
+                print("Deployment cancelled: stdin is not interactive. Use --yes to confirm.\n")
+                return False
+
+            print(f"\n{_RULE}")
             response = input("  Proceed with deployment? [y/N]: ").strip().lower()
-            print("=" * 70 + "\n")
+            print(f"{_RULE}\n")
 
             if response != 'y':
                 print("Deployment cancelled.\n")
                 return False
 
         # Get environment variables
-        project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('PROJECT_ID')
-        region = os.environ.get('GOOGLE_CLOUD_LOCATION') or os.environ.get('REGION', 'us-central1')
+        project_id, region = _gcp_env()
+        region = region or DEFAULT_REGION
 
         # Build deployment command
-        config_file = os.path.join(self.agent_path, '.agent_engine_config.json')
-
         cmd = [
-            'adk', 'deploy', 'agent_engine',
+            *_DEPLOY_CMD_PREFIX,
             '--project', project_id,
             '--region', region,
             self.agent_path,
             '--agent_engine_config_file', config_file
         ]
+        cmd_str = ' '.join(cmd)
 
         print(f"🚀 Deployment Command:")
-        print(f"  {' '.join(cmd)}\n")
+        print(f"  {cmd_str}\n")
 
         if dry_run:
             print("DRY RUN - Command not executed.\n")
             return True
 
+        adk = _find_adk()
+        if adk is None:
+            print("❌ 'adk' command not found. Install with: pip install google-genai-adk\n")
+            return False
+        cmd[0] = adk
+
         # Execute deployment
         self.print_header("🚀 Deploying to Vertex AI")
 
         try:
             print("Starting deployment... (this may take 2-5 minutes)\n")
 
-            result = subprocess.run(cmd, capture_output=not self.verbose, text=True)
-
-            if result.returncode == 0:
+            # Stream output as it arrives instead of buffering the whole deploy log;
+            # keep the tail to show if the deploy fails
+            tail = deque(maxlen=self.OUTPUT_TAIL_LINES)
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, bufsize=1) as proc:
+                for line in proc.stdout:
+                    if self.verbose:
+                        sys.stdout.write(line)
+                    tail.append(line)
+                returncode = proc.wait()
+
+            if returncode == 0:
                 print("\n✓ Deployment successful!")
                 print("\nNext steps:")
                 print("  1. Test your agent with a simple query")
@@ -460,9 +644,10 @@ class DeploymentManager:
                 print("  4. Document your deployment\n")
                 return True
             else:
-                print(f"\n❌ Deployment failed with code {result.returncode}")
+                print(f"\n❌ Deployment failed with code {returncode}")
                 if not self.verbose:
-                    print(f"\nError: {result.stderr}")
+                    print(f"\nLast {len(tail)} lines of output:")
+                    sys.stdout.write(''.join(tail))
                 return False
 
         except FileNotFoundError:
@@ -474,18 +659,26 @@ class DeploymentManager:
 
     def list_deployments(self):
         """List existing deployments."""
-        project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('PROJECT_ID')
-        region = os.environ.get('GOOGLE_CLOUD_LOCATION') or os.environ.get('REGION', 'us-central1')
+        import subprocess
+
+        project_id, region = _gcp_env()
+        region = region or DEFAULT_REGION
 
         if not project_id:
             print("❌ PROJECT_ID not set\n")
             return
 
+        adk = _find_adk()
+        if adk is None:
+            print("❌ 'adk' command not found. Install with: pip install google-genai-adk\n")
+            return
+
         self.print_header(f"📋 Deployments in {project_id} ({region})")
 
         try:
             # This is a placeholder - actual command depends on ADK CLI
-            cmd = ['adk', 'list', 'agent_engines', '--project', project_id, '--region', region]
+            cmd = [*_LIST_CMD_PREFIX, '--project', project_id, '--region', region]
+            cmd[0] = adk
             result = subprocess.run(cmd, capture_output=True, text=True)
 
             if result.returncode == 0:
@@ -503,9 +696,17 @@ class DeploymentManager:
 
 def main():
     """Main CLI entry point."""
+    import argparse
+
+    # Listing needs no agent path or other options; skip building the parser
+    if sys.argv[1:] == ['--list-deployments']:
+        DeploymentManager(DEFAULT_AGENT_PATH).list_deployments()
+        return 0
+
     parser = argparse.ArgumentParser(
         description='Vertex AI Deployment Helper with validation and cost estimation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        allow_abbrev=False,
         epilog="""
 Examples:
   # Validate configuration only
@@ -514,6 +715,9 @@ Examples:
   # Deploy with interactive confirmation
   python deploy_helper.py --agent-path healthcare_agent_deploy
 
+  # Deploy without confirmation (CI / scripts)
+  python deploy_helper.py --agent-path healthcare_agent_deploy --yes
+
   # Dry run (show command without executing)
   python deploy_helper.py --agent-path healthcare_agent_deploy --dry-run
 
@@ -528,8 +732,8 @@ Environment Variables:
 
     parser.add_argument(
         '--agent-path',
-        default='healthcare_agent_deploy',
-        help='Path to agent directory (default: healthcare_agent_deploy)'
+        default=DEFAULT_AGENT_PATH,
+        help=f'Path to agent directory (default: {DEFAULT_AGENT_PATH})'
     )
 
     parser.add_argument(
@@ -550,6 +754,12 @@ Environment Variables:
         help='List existing deployments'
     )
 
+    parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Deploy without asking for confirmation (required when stdin is not a terminal)'
+    )
+
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -572,7 +782,7 @@ Environment Variables:
         return 0 if success else 1
 
     # Deploy
-    success = manager.deploy(dry_run=args.dry_run)
+    success = manager.deploy(dry_run=args.dry_run, yes=args.yes)
     return 0 if success else 1
 
 
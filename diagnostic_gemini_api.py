@@ -12,6 +12,55 @@ This script will:
 5. Provide specific error guidance if anything fails
 """
 
+import re
+
+# Diagnosis and advice for known API errors, in priority order
+_ADVICE = {
+    'invalid_key': (
+        "Invalid API key",
+        "→ Get a new key at: https://aistudio.google.com/app/apikey",
+        "→ Make sure you copied the ENTIRE key",
+        "→ Update Kaggle secret with new key",
+    ),
+    'rate_limit': (
+        "Rate limit or quota exceeded",
+        "→ Wait 60 seconds and try again",
+        "→ Free tier: 10 requests/minute",
+        "→ Check quota: https://aistudio.google.com/app/apikey",
+    ),
+    'permission': (
+        "Permission denied",
+        "→ API might not be enabled for your key",
+        "→ Try generating a new API key",
+    ),
+    'precondition': (
+        "API prerequisites not met",
+        "→ Your API key might need additional setup",
+        "→ Visit: https://aistudio.google.com/",
+    ),
+}
+
+# Error signatures found in API error messages, and the diagnosis each points to
+_ERROR_SIGNATURES = {
+    'API_KEY_INVALID': 'invalid_key',
+    '401': 'invalid_key',
+    '429': 'rate_limit',
+    'ResourceExhausted': 'rate_limit',
+    'RESOURCE_EXHAUSTED': 'rate_limit',
+    'PERMISSION_DENIED': 'permission',
+    '403': 'permission',
+    'FAILED_PRECONDITION': 'precondition',
+}
+_ERR_RE = re.compile('|'.join(map(re.escape, _ERROR_SIGNATURES)))
+_PRIORITY = {category: rank for rank, category in enumerate(_ADVICE)}
+
+
+def diagnose(error_msg):
+    """Key into _ADVICE for the highest-priority signature in error_msg, or None."""
+    categories = {_ERROR_SIGNATURES[match] for match in _ERR_RE.findall(error_msg)}
+    return min(categories, key=_PRIORITY.__getitem__, default=None)
+
+
 print("=" * 60)
 print("GEMINI API DIAGNOSTIC")
 print("=" * 60)
@@ -66,27 +115,12 @@ except Exception as e:
     print(f"   ❌ API call failed: {error_msg[:200]}...")
 
     # Provide specific guidance based on error type
-    if "API_KEY_INVALID" in error_msg or "401" in error_msg:
-        print("\n   💡 Diagnosis: Invalid API key")
-        print("   → Get a new key at: https://aistudio.google.com/app/apikey")
-        print("   → Make sure you copied the ENTIRE key")
-        print("   → Update Kaggle secret with new key")
-
-    elif "429" in error_msg or "ResourceExhausted" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-        print("\n   💡 Diagnosis: Rate limit or quota exceeded")
-        print("   → Wait 60 seconds and try again")
-        print("   → Free tier: 10 requests/minute")
-        print("   → Check quota: https://aistudio.google.com/app/apikey")
-
-    elif "PERMISSION_DENIED" in error_msg or "403" in error_msg:
-        print("\n   💡 Diagnosis: Permission denied")
-        print("   → API might not be enabled for your key")
-        print("   → Try generating a new API key")
-
-    elif "FAILED_PRECONDITION" in error_msg:
-        print("\n   💡 Diagnosis: API prerequisites not met")
-        print("   → Your API key might need additional setup")
-        print("   → Visit: https://aistudio.google.com/")
+    diagnosis = diagnose(error_msg)
+    if diagnosis:
+        summary, *advice = _ADVICE[diagnosis]
+        print(f"\n   💡 Diagnosis: {summary}")
+        for line in advice:
+            print(f"   {line}")
 
     else:
         print("\n   💡 Diagnosis: Unknown error")
@@ -97,17 +131,40 @@ except Exception as e:
 
 # Step 5: Test rate limiting (optional)
 print("\n5. Testing rate limiting (optional)...")
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+async def _rate_test():
+    """Send the test calls concurrently; failures come back as exceptions."""
+    return await asyncio.gather(
+        *(model.generate_content_async(f"Say: Test {i+1}") for i in range(3)),
+        return_exceptions=True
+    )
+
+
 try:
-    import time
-    print("   Making 3 rapid calls to test rate limiting...")
-    for i in range(3):
-        response = model.generate_content(f"Say: Test {i+1}")
-        print(f"   ✅ Call {i+1}: {response.text[:30]}")
-        time.sleep(0.5)  # Small delay
-    print("   ✅ Rate limiting working correctly")
+    print("   Making 3 concurrent calls to test rate limiting...")
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(_rate_test())
+    else:
+        # Notebook cells already run inside an event loop, so use a fresh one in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = pool.submit(asyncio.run, _rate_test()).result()
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    for i, result in enumerate(results):
+        if not isinstance(result, Exception):
+            print(f"   ✅ Call {i+1}: {result.text[:30]}")
+    if failures:
+        print(f"   ⚠️  Rate limit hit (expected for free tier): {str(failures[0])[:100]}")
+        print("   This is normal - your code has rate limiting built in")
+    else:
+        print("   ✅ Rate limiting working correctly")
 except Exception as e:
-    print(f"   ⚠️  Rate limit hit (expected for free tier): {str(e)[:100]}")
-    print("   This is normal - your code has rate limiting built in")
+    print(f"   ⚠️  Rate limit test could not run: {str(e)[:100]}")
 
 print("\n" + "=" * 60)
 print("✅ ALL CHECKS PASSED - Gemini API is working correctly!")
@@ -13,331 +13,295 @@ Installation:
     %run features_export_formats.py
 """
 
+import csv
 import json
-import pandas as pd
+import functools
+import itertools
 import re
-from typing import List, Dict, Optional
+import string
+from html import escape
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger('ADE.ExportFormats')
 
+# Distinct content strings remembered by each cached extraction helper.
+# Cached lists/dicts are shared between calls and must be copied before use.
+_CONTENT_CACHE_SIZE = 1024
+
+# Markdown conversion for the HTML dashboard
+_RE_HEADING = re.compile(r'(#{1,6})\s+(.+)')
+_RE_LIST_ITEM = re.compile(r'[-*]\s+(.+)')
+_RE_INLINE = re.compile(r'`([^`]+)`|\*\*(.+?)\*\*')
+
+# Sections extracted from documentation content
+_RE_DESC = re.compile(r'##?\s*Description:?\s*(.+?)(?:##|\n\n|$)', re.DOTALL | re.IGNORECASE)
+_RE_RANGE = re.compile(r'(?:Valid Range|Range):?\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+_RE_ENUM = re.compile(r'(?:Valid Values|Values|Coding):?\s*\n((?:\s*[-•\d]+[:\.].*\n?)+)', re.IGNORECASE)
+_RE_ENUM_CODE = re.compile(r'(\d+)\s*:')
+# Ontology codes, one named group per schema key (in output order)
+_ONTOLOGY_KEYS = ('omop_concept_id', 'loinc_code', 'snomed_concept_id')
+_RE_ONTOLOGY_CODE = re.compile(
+    r'OMOP[:\s]+(?P<omop_concept_id>\d+)'
+    r'|LOINC[:\s]+(?P<loinc_code>[\d-]+)'
+    r'|SNOMED[:\s]+(?P<snomed_concept_id>\d+)'
+)
+
+# Ontologies shown as dashboard badges, in display order. No name overlaps
+# another, so one alternation scan finds every name a substring check would.
+_BADGE_ONTOLOGIES = ('OMOP', 'LOINC', 'SNOMED', 'ICD')
+_RE_BADGE_ONTOLOGY = re.compile('|'.join(_BADGE_ONTOLOGIES))
+
+# REDCap field extraction (choices and ranges reuse _RE_ENUM and _RE_RANGE)
+_RE_FIELD_LABEL = re.compile(r'Description:?\s*(.+?)(?:\n\n|\*\*|$)', re.DOTALL | re.IGNORECASE)
+_RE_HAS_ENUM = re.compile(r'(?:Valid Values|Values|Coding):', re.IGNORECASE)
+# One "1: Male" / "1. Male" / "- 1: Male" choice per line; [^\S\n] is whitespace within a line
+_RE_CHOICE_LINE = re.compile(r'^[^\S\n]*[-•]?[^\S\n]*(\d+)[^\S\n]*[:\.]?[^\S\n]*(\S(?:.*\S)?)', re.MULTILINE)
+_RE_OMOP = re.compile(r'OMOP[:\s]+(\d+)')
+_RE_LOINC = re.compile(r'LOINC[:\s]+([\d-]+)')
+
+
+def _parse_source(source_data) -> Dict:
+    """Parse a ReviewQueue source_data value; missing or invalid JSON gives {}."""
+    if not source_data:
+        return {}
+    try:
+        return orjson.loads(source_data) if ORJSON_AVAILABLE else json.loads(source_data)
+    except (json.JSONDecodeError, TypeError):
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return {}
+
+
+def _script_json(data) -> str:
+    """Compact JSON (via orjson when installed) that is safe inside a <script> block."""
+    if ORJSON_AVAILABLE:
+        text = orjson.dumps(data).decode()
+    else:
+        text = json.dumps(data, separators=(',', ':'))
+    # '<' only occurs inside strings, so escaping it cannot close the script
+    return text.replace('<', '\\u003c')
+
+
+def _freeze(value):
+    """Hashable, order-preserving form of a JSON-like value."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 # ============================================================================
 # HTML DASHBOARD EXPORT
 # ============================================================================
 
-class HTMLDashboardExporter:
-    """
-    Export documentation as an interactive HTML dashboard.
-
-    Creates a single-page application with:
-    - Searchable/filterable table of variables
-    - Detailed view panels
-    - Ontology mapping visualization
-    - Quality metrics display
-    """
-
-    def __init__(self, db_manager):
-        self.db = db_manager
-
-    def export_to_html(self, job_id: str, output_path: str = None) -> str:
-        """
-        Export job documentation to interactive HTML dashboard.
-
-        Args:
-            job_id: The job ID to export
-            output_path: Path to save HTML file (auto-generated if None)
-
-        Returns:
-            Path to the created HTML file
-        """
-        if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"dashboard_{job_id}_{timestamp}.html"
-
-        # Get approved items
-        query = """
-        SELECT item_id, source_agent, source_data, generated_content,
-               approved_content, status, created_at, updated_at
-        FROM ReviewQueue
-        WHERE job_id = ? AND status = 'Approved'
-        ORDER BY item_id
-        """
-        items = self.db.execute_query(query, (job_id,))
-
-        if not items:
-            raise ValueError(f"No approved items found for job {job_id}")
-
-        # Build HTML
-        html_content = self._generate_html(items, job_id)
-
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        logger.info(f"Exported {len(items)} variables to HTML dashboard: {output_path}")
-        return output_path
-
-    def _generate_html(self, items: List[Dict], job_id: str) -> str:
-        """Generate complete HTML document."""
-
-        # Parse items
-        variables_data = []
-        for item in items:
-            try:
-                source = json.loads(item['source_data'])
-            except:
-                source = {}
-
-            content = item['approved_content'] or item['generated_content']
-
-            var_data = {
-                'name': source.get('variable_name', 'Unknown'),
-                'data_type': source.get('data_type', 'Unknown'),
-                'description': self._extract_brief_description(content),
-                'full_content': content,
-                'ontologies': self._extract_ontology_badges(content),
-                'item_id': item['item_id'],
-                'updated_at': item['updated_at']
-            }
-            variables_data.append(var_data)
-
-        # Build data table rows
-        table_rows = []
-        for var in variables_data:
-            table_rows.append(f"""
-                <tr onclick="showDetails('{var['name']}')" style="cursor: pointer;">
-                    <td>{var['name']}</td>
-                    <td><span class="badge badge-type">{var['data_type']}</span></td>
-                    <td>{var['description']}</td>
-                    <td>{var['ontologies']}</td>
-                    <td>{var['updated_at']}</td>
-                </tr>
-            """)
-
-        # Build detail panels (hidden by default)
-        detail_panels = []
-        for var in variables_data:
-            detail_panels.append(f"""
-                <div id="details-{var['name']}" class="detail-panel" style="display: none;">
-                    <h2>{var['name']}</h2>
-                    <div class="markdown-content">
-                        {self._markdown_to_html(var['full_content'])}
-                    </div>
-                </div>
-            """)
-
-        # Generate JavaScript data
-        js_data = json.dumps(variables_data, indent=2)
-
-        # Complete HTML template
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Dictionary Dashboard - {job_id}</title>
-    <style>
-        * {{
+# Dashboard stylesheet, written into the page as-is (never parsed as a template)
+_DASHBOARD_CSS = """        * {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
             background: #f5f5f5;
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 2rem;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .header .subtitle {{
+        .header .subtitle {
             opacity: 0.9;
             font-size: 0.9rem;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             padding: 2rem;
-        }}
+        }
 
-        .search-bar {{
+        .search-bar {
             background: white;
             padding: 1.5rem;
             margin-bottom: 1rem;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
+        }
 
-        .search-bar input {{
+        .search-bar input {
             width: 100%;
             padding: 0.75rem 1rem;
             border: 2px solid #e0e0e0;
             border-radius: 6px;
             font-size: 1rem;
             transition: border-color 0.3s;
-        }}
+        }
 
-        .search-bar input:focus {{
+        .search-bar input:focus {
             outline: none;
             border-color: #667eea;
-        }}
+        }
 
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1rem;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 1.5rem;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
+        }
 
-        .stat-card .label {{
+        .stat-card .label {
             font-size: 0.85rem;
             color: #666;
             text-transform: uppercase;
             letter-spacing: 0.5px;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .stat-card .value {{
+        .stat-card .value {
             font-size: 2rem;
             font-weight: bold;
             color: #667eea;
-        }}
+        }
 
-        .table-container {{
+        .table-container {
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.05);
             overflow: hidden;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
-        }}
+        }
 
-        thead {{
+        thead {
             background: #f8f9fa;
-        }}
+        }
 
-        th {{
+        th {
             padding: 1rem;
             text-align: left;
             font-weight: 600;
             color: #333;
             border-bottom: 2px solid #e0e0e0;
-        }}
+        }
 
-        td {{
+        td {
             padding: 1rem;
             border-bottom: 1px solid #f0f0f0;
-        }}
+        }
 
-        tr:hover {{
+        tr:hover {
             background: #f8f9fa;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 0.25rem 0.75rem;
             border-radius: 12px;
             font-size: 0.85rem;
             font-weight: 500;
-        }}
+        }
 
-        .badge-type {{
+        .badge-type {
             background: #e3f2fd;
             color: #1976d2;
-        }}
+        }
 
-        .badge-ontology {{
+        .badge-ontology {
             background: #f3e5f5;
             color: #7b1fa2;
             margin-right: 0.25rem;
-        }}
+        }
 
-        .detail-panel {{
+        .detail-panel {
             background: white;
             padding: 2rem;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.05);
             margin-top: 1rem;
-        }}
+        }
 
-        .detail-panel h2 {{
+        .detail-panel h2 {
             color: #667eea;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .markdown-content {{
+        .markdown-content {
             line-height: 1.8;
-        }}
+        }
 
-        .markdown-content h2 {{
+        .markdown-content h2 {
             color: #333;
             margin-top: 1.5rem;
             margin-bottom: 0.75rem;
             font-size: 1.5rem;
-        }}
+        }
 
-        .markdown-content h3 {{
+        .markdown-content h3 {
             color: #555;
             margin-top: 1rem;
             margin-bottom: 0.5rem;
             font-size: 1.25rem;
-        }}
+        }
 
-        .markdown-content p {{
+        .markdown-content p {
             margin-bottom: 1rem;
-        }}
+        }
 
-        .markdown-content ul, .markdown-content ol {{
+        .markdown-content ul, .markdown-content ol {
             margin-left: 2rem;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .markdown-content li {{
+        .markdown-content li {
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .markdown-content code {{
+        .markdown-content code {
             background: #f5f5f5;
             padding: 0.2rem 0.4rem;
             border-radius: 3px;
             font-family: 'Courier New', monospace;
             font-size: 0.9rem;
-        }}
+        }
 
-        .markdown-content pre {{
+        .markdown-content pre {
             background: #f5f5f5;
             padding: 1rem;
             border-radius: 6px;
             overflow-x: auto;
             margin-bottom: 1rem;
-        }}
+        }
 
-        .back-button {{
+        .back-button {
             display: inline-block;
             padding: 0.75rem 1.5rem;
             background: #667eea;
@@ -348,31 +312,47 @@ class HTMLDashboardExporter:
             font-size: 1rem;
             margin-bottom: 1rem;
             text-decoration: none;
-        }}
+        }
 
-        .back-button:hover {{
+        .back-button:hover {
             background: #5568d3;
-        }}
+        }
 
-        #tableView {{
+        #tableView {
             display: block;
-        }}
+        }
 
-        #detailView {{
+        #detailView {
             display: none;
-        }}
+        }
 
-        .no-results {{
+        .no-results {
             text-align: center;
             padding: 3rem;
             color: #999;
-        }}
-    </style>
+        }
+
+        .hidden {
+            display: none;
+        }
+"""
+
+# Dashboard page, written by HTMLDashboardExporter._write_html with the
+# stylesheet, table rows and detail panels streamed in at $css, $rows and
+# $panels. Parsed once at import; $-placeholders leave the JS braces as written.
+_DASHBOARD_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Data Dictionary Dashboard - $job_id</title>
+    <style>
+$css    </style>
 </head>
 <body>
     <div class="header">
         <h1>📊 Data Dictionary Dashboard</h1>
-        <div class="subtitle">Job ID: {job_id} | Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}</div>
+        <div class="subtitle">Job ID: $job_id | Generated: $generated_at</div>
     </div>
 
     <div class="container">
@@ -384,15 +364,15 @@ class HTMLDashboardExporter:
             <div class="stats">
                 <div class="stat-card">
                     <div class="label">Total Variables</div>
-                    <div class="value" id="totalVars">{len(variables_data)}</div>
+                    <div class="value" id="totalVars">$total</div>
                 </div>
                 <div class="stat-card">
                     <div class="label">Documented</div>
-                    <div class="value">{len(variables_data)}</div>
+                    <div class="value">$total</div>
                 </div>
                 <div class="stat-card">
                     <div class="label">Last Updated</div>
-                    <div class="value" style="font-size: 1.2rem;">{items[0]['updated_at'] if items else 'N/A'}</div>
+                    <div class="value" style="font-size: 1.2rem;">$last_updated</div>
                 </div>
             </div>
 
@@ -408,7 +388,7 @@ class HTMLDashboardExporter:
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(table_rows)}
+                        $rows
                     </tbody>
                 </table>
             </div>
@@ -417,37 +397,33 @@ class HTMLDashboardExporter:
         <div id="detailView">
             <button class="back-button" onclick="showTable()">← Back to Table</button>
             <div id="detailContent">
-                {''.join(detail_panels)}
+                $panels
             </div>
         </div>
     </div>
 
     <script>
-        const variablesData = {js_data};
+        // Lowercased text of each table row, in row order
+        const searchIndex = $search_index;
 
-        function filterTable() {{
+        function filterTable() {
             const input = document.getElementById('searchInput');
-            const filter = input.value.toUpperCase();
-            const table = document.getElementById('variablesTable');
-            const rows = table.getElementsByTagName('tr');
+            const filter = input.value.toLowerCase();
+            const rows = document.getElementById('variablesTable').tBodies[0].rows;
             let visibleCount = 0;
 
-            for (let i = 1; i < rows.length; i++) {{
-                const row = rows[i];
-                const text = row.textContent || row.innerText;
-
-                if (text.toUpperCase().indexOf(filter) > -1) {{
-                    row.style.display = '';
+            for (let i = 0; i < searchIndex.length; i++) {
+                const hidden = searchIndex[i].indexOf(filter) < 0;
+                rows[i].classList.toggle('hidden', hidden);
+                if (!hidden) {
                     visibleCount++;
-                }} else {{
-                    row.style.display = 'none';
-                }}
-            }}
+                }
+            }
 
             document.getElementById('totalVars').textContent = visibleCount;
-        }}
+        }
 
-        function showDetails(varName) {{
+        function showDetails(index) {
             document.getElementById('tableView').style.display = 'none';
             document.getElementById('detailView').style.display = 'block';
 
@@ -456,88 +432,246 @@ class HTMLDashboardExporter:
             panels.forEach(panel => panel.style.display = 'none');
 
             // Show selected panel
-            const panel = document.getElementById('details-' + varName);
-            if (panel) {{
+            const panel = document.getElementById('details-' + index);
+            if (panel) {
                 panel.style.display = 'block';
-            }}
+            }
 
             // Scroll to top
             window.scrollTo(0, 0);
-        }}
+        }
 
-        function showTable() {{
+        function showTable() {
             document.getElementById('tableView').style.display = 'block';
             document.getElementById('detailView').style.display = 'none';
             window.scrollTo(0, 0);
-        }}
+        }
 
         // Keyboard navigation
-        document.addEventListener('keydown', function(e) {{
-            if (e.key === 'Escape') {{
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') {
                 showTable();
-            }}
-        }});
+            }
+        });
     </script>
 </body>
 </html>"""
+_DASHBOARD_TOP, _DASHBOARD_HEAD, _DASHBOARD_MIDDLE, _DASHBOARD_TAIL = (
+    string.Template(part) for part in re.split(r'\$css|\$rows|\$panels', _DASHBOARD_PAGE))
 
-        return html
 
-    def _extract_brief_description(self, content: str) -> str:
-        """Extract brief description from content."""
-        # Look for description section
-        match = re.search(r'##?\s*Description:?\s*(.+?)(?:##|\n\n|$)', content, re.DOTALL | re.IGNORECASE)
-        if match:
-            desc = match.group(1).strip()
-            # Take first sentence or 150 chars
-            first_sentence = desc.split('.')[0]
-            return first_sentence[:150] if len(first_sentence) < 150 else first_sentence[:147] + '...'
-        return "No description available"
+class HTMLDashboardExporter:
+    """
+    Export documentation as an interactive HTML dashboard.
+
+    Creates a single-page application with:
+    - Searchable/filterable table of variables
+    - Detailed view panels
+    - Ontology mapping visualization
+    - Quality metrics display
+    """
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+
+    def export_to_html(self, job_id: str, output_path: str = None) -> str:
+        """
+        Export job documentation to interactive HTML dashboard.
+
+        Args:
+            job_id: The job ID to export
+            output_path: Path to save HTML file (auto-generated if None)
+
+        Returns:
+            Path to the created HTML file
+        """
+        # One timestamp for the file name and the page header
+        now = datetime.now()
+        if output_path is None:
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            output_path = f"dashboard_{job_id}_{timestamp}.html"
+
+        # Get approved items
+        query = """
+        SELECT source_data, generated_content, approved_content, updated_at
+        FROM ReviewQueue
+        WHERE job_id = ? AND status = 'Approved'
+        ORDER BY item_id
+        """
+        items = self.db.execute_query(query, (job_id,))
 
-    def _extract_ontology_badges(self, content: str) -> str:
-        """Extract and format ontology mappings as HTML badges."""
-        badges = []
+        if not items:
+            raise ValueError(f"No approved items found for job {job_id}")
+
+        # Write HTML straight to the file rather than building it in memory
+        with open(output_path, 'w', encoding='utf-8') as f:
+            self._write_html(f, items, job_id, now)
 
-        if 'OMOP' in content:
-            badges.append('<span class="badge badge-ontology">OMOP</span>')
-        if 'LOINC' in content:
-            badges.append('<span class="badge badge-ontology">LOINC</span>')
-        if 'SNOMED' in content:
-            badges.append('<span class="badge badge-ontology">SNOMED</span>')
-        if 'ICD' in content:
-            badges.append('<span class="badge badge-ontology">ICD</span>')
+        logger.info(f"Exported {len(items)} variables to HTML dashboard: {output_path}")
+        return output_path
 
-        return ''.join(badges) if badges else '<span style="color: #999;">None</span>'
+    def _write_html(self, f, items: List[Dict], job_id: str, generated_at: datetime):
+        """Write the complete HTML document to f, one row and panel at a time; items is non-empty."""
+        job_id_html = escape(job_id)
+        f.write(_DASHBOARD_TOP.substitute(job_id=job_id_html))
+        f.write(_DASHBOARD_CSS)
+        f.write(_DASHBOARD_HEAD.substitute(
+            job_id=job_id_html,
+            generated_at=generated_at.strftime("%Y-%m-%d %H:%M"),
+            total=len(items),
+            last_updated=escape(str(items[0]['updated_at']))
+        ))
+
+        # Data table rows; panels are addressed by row position, so names
+        # never reach the id or the onclick handler and duplicates stay distinct
+        names_html = []
+        search_index = []
+        for index, item in enumerate(items):
+            source = _parse_source(item['source_data'])
 
-    def _markdown_to_html(self, markdown: str) -> str:
-        """Convert markdown to HTML (basic conversion)."""
-        html = markdown
+            content = item['approved_content'] or item['generated_content']
+            name = source.get('variable_name', 'Unknown')
+            data_type = source.get('data_type', 'Unknown')
+            description, ontologies, ontology_text = self._summarize_content(content)
+            updated_at = item['updated_at']
+
+            name_html = escape(str(name))
+            names_html.append(name_html)
+            f.write(f"""
+                <tr onclick="showDetails({index})" style="cursor: pointer;">
+                    <td>{name_html}</td>
+                    <td><span class="badge badge-type">{escape(str(data_type))}</span></td>
+                    <td>{escape(description)}</td>
+                    <td>{ontologies}</td>
+                    <td>{escape(str(updated_at))}</td>
+                </tr>
+            """)
+            # Same text the row displays, without the badge markup
+            search_index.append(f"{name} {data_type} {description} {ontology_text} {updated_at}".lower())
 
-        # Headers
-        html = re.sub(r'###\s+(.+)', r'<h3>\1</h3>', html)
-        html = re.sub(r'##\s+(.+)', r'<h2>\1</h2>', html)
+        f.write(_DASHBOARD_MIDDLE.template)
 
-        # Bold
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
+        # Detail panels (hidden by default)
+        markdown_to_html = self._markdown_to_html
+        for index, (item, name_html) in enumerate(zip(items, names_html)):
+            content = item['approved_content'] or item['generated_content']
+            f.write(f"""
+                <div id="details-{index}" class="detail-panel" style="display: none;">
+                    <h2>{name_html}</h2>
+                    <div class="markdown-content">
+                        {markdown_to_html(content)}
+                    </div>
+                </div>
+            """)
 
-        # Lists
-        html = re.sub(r'^\s*-\s+(.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'(<li>.*</li>)', r'<ul>\1</ul>', html, flags=re.DOTALL)
+        f.write(_DASHBOARD_TAIL.substitute(search_index=_script_json(search_index)))
 
-        # Paragraphs
-        html = re.sub(r'\n\n', '</p><p>', html)
-        html = f'<p>{html}</p>'
+    @staticmethod
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+    def _summarize_content(content: str) -> Tuple[str, str, str]:
+        """
+        Extract everything a table row shows from content in one call.
 
-        # Code blocks
-        html = re.sub(r'`([^`]+)`', r'<code>\1</code>', html)
+        Returns the brief description, the ontology badges as HTML and the
+        badge text without markup (for the search index).
+        """
+        # Brief description: first sentence of the description section, max 150 chars
+        match = _RE_DESC.search(content)
+        if match:
+            first_sentence = match.group(1).strip().split('.')[0]
+            description = first_sentence[:150] if len(first_sentence) < 150 else first_sentence[:147] + '...'
+        else:
+            description = "No description available"
+
+        found = set(_RE_BADGE_ONTOLOGY.findall(content))
+        names = [name for name in _BADGE_ONTOLOGIES if name in found]
+        if not names:
+            return description, '<span style="color: #999;">None</span>', 'None'
+        badges = ''.join(f'<span class="badge badge-ontology">{name}</span>' for name in names)
+        return description, badges, ''.join(names)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+    def _markdown_to_html(markdown: str) -> str:
+        """
+        Convert markdown to HTML (basic conversion) in one pass over the lines.
 
-        return html
+        Supports headings, "-"/"*" lists, blank-line separated paragraphs,
+        **bold** and `code`. Text is HTML-escaped first.
+        """
+        def inline(text: str) -> str:
+            # Code spans and bold in one scan; code wins where they overlap
+            return _RE_INLINE.sub(
+                lambda m: f'<code>{m.group(1)}</code>' if m.group(1) is not None
+                else f'<strong>{m.group(2)}</strong>',
+                escape(text, quote=False))
+
+        blocks = []
+        paragraph = []
+        list_items = []
+
+        def close_paragraph():
+            if paragraph:
+                blocks.append(f"<p>{' '.join(paragraph)}</p>")
+                paragraph.clear()
+
+        def close_list():
+            if list_items:
+                blocks.append(f"<ul>{''.join(list_items)}</ul>")
+                list_items.clear()
+
+        for line in markdown.splitlines():
+            line = line.strip()
+            if not line:
+                close_paragraph()
+                close_list()
+                continue
+
+            heading = _RE_HEADING.match(line)
+            if heading:
+                close_paragraph()
+                close_list()
+                level = len(heading.group(1))
+                blocks.append(f'<h{level}>{inline(heading.group(2))}</h{level}>')
+                continue
+
+            item = _RE_LIST_ITEM.match(line)
+            if item:
+                close_paragraph()
+                list_items.append(f'<li>{inline(item.group(1))}</li>')
+            else:
+                close_list()
+                paragraph.append(inline(line))
+
+        close_paragraph()
+        close_list()
+        return '\n'.join(blocks)
 
 
 # ============================================================================
 # JSON SCHEMA EXPORT
 # ============================================================================
 
+# Map data types to JSON Schema types
+_JSON_SCHEMA_TYPES = {
+    'integer': 'integer',
+    'int': 'integer',
+    'float': 'number',
+    'double': 'number',
+    'numeric': 'number',
+    'string': 'string',
+    'text': 'string',
+    'boolean': 'boolean',
+    'bool': 'boolean',
+    'date': 'string',
+    'datetime': 'string',
+    'timestamp': 'string',
+}
+# Data types given a "format"; those with a time part are "date-time"
+_DATE_TYPES = frozenset({'date', 'datetime', 'timestamp'})
+_DATETIME_TYPES = frozenset({'datetime', 'timestamp'})
+
+
 @dataclass
 class JSONSchemaField:
     """JSON Schema representation of a data dictionary field."""
@@ -573,14 +707,15 @@ class JSONSchemaExporter:
         Returns:
             Path to the created JSON Schema file
         """
+        # One timestamp for the file name and the schema description
+        now = datetime.now()
         if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             output_path = f"schema_{job_id}_{timestamp}.json"
 
         # Get approved items
         query = """
-        SELECT item_id, source_agent, source_data, generated_content,
-               approved_content, status
+        SELECT item_id, source_data, generated_content, approved_content
         FROM ReviewQueue
         WHERE job_id = ? AND status = 'Approved'
         ORDER BY item_id
@@ -591,25 +726,31 @@ class JSONSchemaExporter:
             raise ValueError(f"No approved items found for job {job_id}")
 
         # Build schema
-        schema = self._build_schema(items, job_id)
+        schema = self._build_schema(items, job_id, now)
 
         # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(schema, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(schema, f, indent=2)
 
         logger.info(f"Exported {len(items)} fields to JSON Schema: {output_path}")
         return output_path
 
-    def _build_schema(self, items: List[Dict], job_id: str) -> Dict:
-        """Build JSON Schema from items."""
-        properties = {}
+    def _build_schema(self, items: List[Dict], job_id: str, generated_at: Optional[datetime] = None) -> Dict:
+        """Build JSON Schema from items, stamped with generated_at (default: now)."""
+        if generated_at is None:
+            generated_at = datetime.now()
+        # (name, schema) pairs, turned into the properties dict in one step
+        fields = []
         required = []
+        # Identical field schemas share one dict within this schema
+        shared_schemas = {}
 
         for item in items:
-            try:
-                source = json.loads(item['source_data'])
-            except:
-                source = {}
+            source = _parse_source(item['source_data'])
 
             content = item['approved_content'] or item['generated_content']
 
@@ -618,7 +759,8 @@ class JSONSchemaExporter:
 
             # Build field schema
             field_schema = self._build_field_schema(var_name, data_type, content, source)
-            properties[var_name] = field_schema
+            field_schema = shared_schemas.setdefault(_freeze(field_schema), field_schema)
+            fields.append((var_name, field_schema))
 
             # Check if required (simple heuristic: not nullable)
             if not source.get('nullable', True):
@@ -629,9 +771,9 @@ class JSONSchemaExporter:
             "$schema": "http://json-schema.org/draft-07/schema#",
             "$id": f"https://example.com/schemas/{job_id}.json",
             "title": f"Data Dictionary Schema - {job_id}",
-            "description": f"JSON Schema for data validation (generated {datetime.now().isoformat()})",
+            "description": f"JSON Schema for data validation (generated {generated_at.isoformat()})",
             "type": "object",
-            "properties": properties
+            "properties": dict(fields)
         }
 
         if required:
@@ -645,33 +787,18 @@ class JSONSchemaExporter:
             "description": self._extract_description(content)
         }
 
-        # Map data types to JSON Schema types
-        type_mapping = {
-            'integer': 'integer',
-            'int': 'integer',
-            'float': 'number',
-            'double': 'number',
-            'numeric': 'number',
-            'string': 'string',
-            'text': 'string',
-            'boolean': 'boolean',
-            'bool': 'boolean',
-            'date': 'string',
-            'datetime': 'string',
-            'timestamp': 'string',
-        }
-
-        json_type = type_mapping.get(data_type.lower(), 'string')
+        data_type_lower = data_type.lower()
+        json_type = _JSON_SCHEMA_TYPES.get(data_type_lower, 'string')
         field["type"] = json_type
 
         # Add format for dates
-        if data_type.lower() in ['date', 'datetime', 'timestamp']:
-            field["format"] = "date-time" if 'time' in data_type.lower() else "date"
+        if data_type_lower in _DATE_TYPES:
+            field["format"] = "date-time" if data_type_lower in _DATETIME_TYPES else "date"
 
         # Extract constraints from content
         constraints = self._extract_constraints(content)
 
-        if json_type in ['integer', 'number']:
+        if json_type in ('integer', 'number'):
             if constraints.get('min') is not None:
                 field["minimum"] = constraints['min']
             if constraints.get('max') is not None:
@@ -680,68 +807,65 @@ class JSONSchemaExporter:
         # Extract enum values if categorical
         enum_values = self._extract_enum_values(content)
         if enum_values:
-            field["enum"] = enum_values
+            field["enum"] = list(enum_values)
 
         # Add ontology mappings as custom property
         ontologies = self._extract_ontologies_for_schema(content)
         if ontologies:
-            field["x-ontology-mappings"] = ontologies
+            field["x-ontology-mappings"] = dict(ontologies)
 
         return field
 
-    def _extract_description(self, content: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+    def _extract_description(content: str) -> str:
         """Extract description from content."""
-        match = re.search(r'##?\s*Description:?\s*(.+?)(?:##|\n\n|$)', content, re.DOTALL | re.IGNORECASE)
+        match = _RE_DESC.search(content)
         if match:
             return match.group(1).strip()
         return "No description available"
 
-    def _extract_constraints(self, content: str) -> Dict:
+    @staticmethod
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+    def _extract_constraints(content: str) -> Dict:
         """Extract numeric constraints from content."""
         constraints = {}
 
         # Look for range specifications
-        range_match = re.search(r'(?:Valid Range|Range):?\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)', content, re.IGNORECASE)
+        range_match = _RE_RANGE.search(content)
         if range_match:
             constraints['min'] = float(range_match.group(1))
             constraints['max'] = float(range_match.group(2))
 
         return constraints
 
-    def _extract_enum_values(self, content: str) -> Optional[List]:
+    @staticmethod
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+    def _extract_enum_values(content: str) -> Optional[List]:
         """Extract enum values from content."""
         # Look for value mappings like "1: Male, 2: Female"
-        pattern = r'(?:Valid Values|Values|Coding):?\s*\n((?:\s*[-•\d]+[:\.].*\n?)+)'
-        match = re.search(pattern, content, re.IGNORECASE)
+        match = _RE_ENUM.search(content)
 
         if match:
             values_text = match.group(1)
             # Extract numeric codes
-            codes = re.findall(r'(\d+)\s*:', values_text)
+            codes = _RE_ENUM_CODE.findall(values_text)
             if codes:
                 return [int(c) for c in codes]
 
         return None
 
-    def _extract_ontologies_for_schema(self, content: str) -> Dict:
-        """Extract ontology mappings for schema."""
-        ontologies = {}
-
-        # OMOP
-        omop_matches = re.findall(r'OMOP[:\s]+(\d+)', content)
-        if omop_matches:
-            ontologies['omop_concept_id'] = omop_matches[0]
-
-        # LOINC
-        loinc_matches = re.findall(r'LOINC[:\s]+([\d-]+)', content)
-        if loinc_matches:
-            ontologies['loinc_code'] = loinc_matches[0]
-
-        # SNOMED
-        snomed_matches = re.findall(r'SNOMED[:\s]+(\d+)', content)
-        if snomed_matches:
-            ontologies['snomed_concept_id'] = snomed_matches[0]
-
+    @staticmethod
+    @functools.lru_cache(maxsize=_CONTENT_CACHE_SIZE)
+    def _extract_ontologies_for_schema(content: str) -> Dict:
+        """Extract ontology mappings for schema (first code of each kind)."""
+        found = {}
+        for match in _RE_ONTOLOGY_CODE.finditer(content):
+            found.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if len(found) == len(_ONTOLOGY_KEYS):
+                break
+
+        ontologies = {key: found[key] for key in _ONTOLOGY_KEYS if key in found}
         return ontologies if ontologies else None
 
 
@@ -749,6 +873,51 @@ class JSONSchemaExporter:
 # REDCAP DATA DICTIONARY EXPORT
 # ============================================================================
 
+# Data dictionary columns, in the order REDCap expects them
+_REDCAP_COLUMNS = (
+    'Variable / Field Name',
+    'Form Name',
+    'Section Header',
+    'Field Type',
+    'Field Label',
+    'Choices, Calculations, OR Slider Labels',
+    'Field Note',
+    'Text Validation Type OR Show Slider Number',
+    'Text Validation Min',
+    'Text Validation Max',
+    'Identifier?',
+    'Branching Logic (Show field only if...)',
+    'Required Field?',
+    'Custom Alignment',
+    'Question Number (surveys only)',
+    'Matrix Group Name',
+    'Matrix Ranking?',
+    'Field Annotation'
+)
+# Map lowercased data types to REDCap field types and text validation types
+_REDCAP_FIELD_TYPES = {
+    'integer': 'text',
+    'int': 'text',
+    'float': 'text',
+    'double': 'text',
+    'string': 'text',
+    'text': 'notes',
+    'boolean': 'yesno',
+    'date': 'text',
+    'datetime': 'text'
+}
+_REDCAP_VALIDATION_TYPES = {
+    'integer': 'integer',
+    'int': 'integer',
+    'float': 'number',
+    'double': 'number',
+    'date': 'date_ymd',
+    'datetime': 'datetime_ymd',
+    'email': 'email',
+    'phone': 'phone'
+}
+
+
 class REDCapExporter:
     """
     Export to REDCap data dictionary format.
@@ -800,77 +969,48 @@ class REDCapExporter:
         WHERE job_id = ? AND status = 'Approved'
         ORDER BY item_id
         """
-        items = self.db.execute_query(query, (job_id,))
-
-        if not items:
+        # Stream rows when the database manager supports it
+        execute_query_iter = getattr(self.db, 'execute_query_iter', None)
+        if execute_query_iter is not None:
+            items = execute_query_iter(query, (job_id,))
+        else:
+            items = iter(self.db.execute_query(query, (job_id,)))
+
+        first = next(items, None)
+        if first is None:
             raise ValueError(f"No approved items found for job {job_id}")
 
-        # Build REDCap rows
-        redcap_rows = []
-        for item in items:
-            try:
-                source = json.loads(item['source_data'])
-            except:
-                source = {}
+        # Write each row as it is built; columns a row leaves out are written empty
+        count = 0
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=_REDCAP_COLUMNS, restval='', lineterminator='\n')
+            writer.writeheader()
+            for item in itertools.chain((first,), items):
+                source = _parse_source(item['source_data'])
 
-            content = item['approved_content'] or item['generated_content']
-            redcap_row = self._build_redcap_row(source, content, form_name)
-            redcap_rows.append(redcap_row)
-
-        # Create DataFrame
-        df = pd.DataFrame(redcap_rows)
-
-        # Ensure all required columns exist
-        required_columns = [
-            'Variable / Field Name',
-            'Form Name',
-            'Section Header',
-            'Field Type',
-            'Field Label',
-            'Choices, Calculations, OR Slider Labels',
-            'Field Note',
-            'Text Validation Type OR Show Slider Number',
-            'Text Validation Min',
-            'Text Validation Max',
-            'Identifier?',
-            'Branching Logic (Show field only if...)',
-            'Required Field?',
-            'Custom Alignment',
-            'Question Number (surveys only)',
-            'Matrix Group Name',
-            'Matrix Ranking?',
-            'Field Annotation'
-        ]
-
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = ''
-
-        # Reorder columns
-        df = df[required_columns]
-
-        # Save
-        df.to_csv(output_path, index=False)
-
-        logger.info(f"Exported {len(redcap_rows)} fields to REDCap format: {output_path}")
+                content = item['approved_content'] or item['generated_content']
+                writer.writerow(self._build_redcap_row(source, content, form_name))
+                count += 1
+
+        logger.info(f"Exported {count} fields to REDCap format: {output_path}")
         return output_path
 
     def _build_redcap_row(self, source: Dict, content: str, form_name: str) -> Dict:
         """Build a single REDCap row."""
         var_name = source.get('variable_name', 'unknown')
-        data_type = source.get('data_type', 'text')
+        data_type_lower = source.get('data_type', 'text').lower()
 
         # Extract field label (description)
         field_label = self._extract_field_label(content)
 
         # Map data type to REDCap field type
-        field_type = self._map_to_redcap_type(data_type, content)
+        field_type = self._map_to_redcap_type(data_type_lower, content)
 
         # Extract choices for categorical variables
         choices = self._extract_redcap_choices(content)
 
         # Extract validation
-        validation_type = self._get_validation_type(data_type)
+        validation_type = self._get_validation_type(data_type_lower)
 
         # Extract min/max
         min_val, max_val = self._extract_min_max(content)
@@ -894,79 +1034,40 @@ class REDCapExporter:
 
     def _extract_field_label(self, content: str) -> str:
         """Extract field label from content."""
-        match = re.search(r'Description:?\s*(.+?)(?:\n\n|\*\*|$)', content, re.DOTALL | re.IGNORECASE)
+        match = _RE_FIELD_LABEL.search(content)
         if match:
             label = match.group(1).strip()
             return label[:200]  # REDCap has limits
         return "No description"
 
-    def _map_to_redcap_type(self, data_type: str, content: str) -> str:
-        """Map data type to REDCap field type."""
-        data_type_lower = data_type.lower()
-
+    def _map_to_redcap_type(self, data_type_lower: str, content: str) -> str:
+        """Map a lowercased data type to REDCap field type."""
         # Check for categorical first
         if self._has_enum_values(content):
             return 'radio'  # or 'dropdown'
 
-        type_mapping = {
-            'integer': 'text',
-            'int': 'text',
-            'float': 'text',
-            'double': 'text',
-            'string': 'text',
-            'text': 'notes',
-            'boolean': 'yesno',
-            'date': 'text',
-            'datetime': 'text'
-        }
-
-        return type_mapping.get(data_type_lower, 'text')
+        return _REDCAP_FIELD_TYPES.get(data_type_lower, 'text')
 
     def _extract_redcap_choices(self, content: str) -> str:
         """Extract choices in REDCap format: "1, Male | 2, Female"."""
-        pattern = r'(?:Valid Values|Values|Coding):?\s*\n((?:\s*[-•\d]+[:\.].*\n?)+)'
-        match = re.search(pattern, content, re.IGNORECASE)
+        match = _RE_ENUM.search(content)
 
         if match:
-            values_text = match.group(1)
-            # Parse "1: Male" format
-            choices = []
-            for line in values_text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                # Match "1: Male" or "1. Male" or "- 1: Male"
-                choice_match = re.match(r'[-•]?\s*(\d+)\s*[:\.]?\s*(.+)', line)
-                if choice_match:
-                    code = choice_match.group(1)
-                    label = choice_match.group(2).strip()
-                    choices.append(f"{code}, {label}")
-
-            return ' | '.join(choices) if choices else ''
+            return ' | '.join(f"{code}, {label}" for code, label in _RE_CHOICE_LINE.findall(match.group(1)))
 
         return ''
 
     def _has_enum_values(self, content: str) -> bool:
         """Check if content has enum values."""
-        return bool(re.search(r'(?:Valid Values|Values|Coding):', content, re.IGNORECASE))
-
-    def _get_validation_type(self, data_type: str) -> str:
-        """Get REDCap validation type."""
-        mapping = {
-            'integer': 'integer',
-            'int': 'integer',
-            'float': 'number',
-            'double': 'number',
-            'date': 'date_ymd',
-            'datetime': 'datetime_ymd',
-            'email': 'email',
-            'phone': 'phone'
-        }
-        return mapping.get(data_type.lower(), '')
+        return bool(_RE_HAS_ENUM.search(content))
+
+    def _get_validation_type(self, data_type_lower: str) -> str:
+        """Get REDCap validation type for a lowercased data type."""
+        return _REDCAP_VALIDATION_TYPES.get(data_type_lower, '')
 
     def _extract_min_max(self, content: str) -> tuple:
         """Extract min and max values."""
-        range_match = re.search(r'(?:Valid Range|Range):?\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)', content, re.IGNORECASE)
+        range_match = _RE_RANGE.search(content)
         if range_match:
             return range_match.group(1), range_match.group(2)
         return '', ''
@@ -975,11 +1076,11 @@ class REDCapExporter:
         """Build field note from ontology mappings."""
         notes = []
 
-        omop = re.search(r'OMOP[:\s]+(\d+)', content)
+        omop = _RE_OMOP.search(content)
         if omop:
             notes.append(f"OMOP: {omop.group(1)}")
 
-        loinc = re.search(r'LOINC[:\s]+([\d-]+)', content)
+        loinc = _RE_LOINC.search(content)
         if loinc:
             notes.append(f"LOINC: {loinc.group(1)}")
 
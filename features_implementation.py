@@ -22,6 +22,7 @@ Installation:
 
 import sqlite3
 import json
+import functools
 import pandas as pd
 import io
 import logging
@@ -253,6 +254,19 @@ class CommentsWidget:
 # FEATURE 2: QUALITY SCORE DISPLAY
 # ============================================================================
 
+# Distinct content strings whose quality scores are remembered
+_SCORE_CACHE_SIZE = 4096
+
+# Quality checks, compiled once rather than per scored item
+_REQUIRED_SECTIONS = tuple(
+    (section, section.lower()) for section in ('Variable:', 'Description:', 'Data Type:', 'Values:'))
+_RE_CONCEPT_ID = re.compile(r'\b\d{5,}\b')
+_JARGON_PATTERNS = (
+    (re.compile(r'\b(PHI|PII|HIPAA)\b'), "Consider explaining acronyms"),
+    (re.compile(r'\bNULL\b'), "Explain what NULL/missing values mean"),
+)
+
+
 @dataclass
 class QualityMetrics:
     """Quality metrics for a documented field."""
@@ -283,6 +297,25 @@ class QualityScoreCalculator:
         Returns:
             QualityMetrics with scores and feedback
         """
+        if metadata or type(self) is not QualityScoreCalculator:
+            # Metadata may be unhashable, and subclasses may change the checks,
+            # so only the base checks on content alone are cached
+            scores = self._score(content, metadata)
+        else:
+            scores = _score_content(content)
+
+        overall_score, completeness_score, ontology_score, clarity_score, issues, suggestions = scores
+        return QualityMetrics(
+            overall_score=overall_score,
+            completeness_score=completeness_score,
+            ontology_mapping_score=ontology_score,
+            clarity_score=clarity_score,
+            issues=list(issues),
+            suggestions=list(suggestions)
+        )
+
+    def _score(self, content: str, metadata: Optional[Dict]) -> Tuple:
+        """Run all checks; feedback is returned as tuples so results can be cached."""
         issues = []
         suggestions = []
 
@@ -302,22 +335,22 @@ class QualityScoreCalculator:
             clarity_score * 0.3
         )
 
-        return QualityMetrics(
-            overall_score=round(overall_score, 1),
-            completeness_score=round(completeness_score, 1),
-            ontology_mapping_score=round(ontology_score, 1),
-            clarity_score=round(clarity_score, 1),
-            issues=issues,
-            suggestions=suggestions
+        return (
+            round(overall_score, 1),
+            round(completeness_score, 1),
+            round(ontology_score, 1),
+            round(clarity_score, 1),
+            tuple(issues),
+            tuple(suggestions)
         )
 
     def _assess_completeness(self, content: str, issues: List, suggestions: List) -> float:
         """Assess documentation completeness."""
         score = 100.0
-        required_sections = ['Variable:', 'Description:', 'Data Type:', 'Values:']
+        content_lower = content.lower()
 
-        for section in required_sections:
-            if section.lower() not in content.lower():
+        for section, section_lower in _REQUIRED_SECTIONS:
+            if section_lower not in content_lower:
                 score -= 20
                 issues.append(f"Missing section: {section}")
 
@@ -327,7 +360,7 @@ class QualityScoreCalculator:
             issues.append("Documentation too brief (< 100 characters)")
 
         # Bonus for examples
-        if 'example' in content.lower() or 'e.g.' in content.lower():
+        if 'example' in content_lower or 'e.g.' in content_lower:
             score = min(100, score + 10)
         else:
             suggestions.append("Consider adding examples")
@@ -354,7 +387,7 @@ class QualityScoreCalculator:
             score = 100
 
         # Check for concept IDs (numeric codes)
-        if not re.search(r'\b\d{5,}\b', content):
+        if not _RE_CONCEPT_ID.search(content):
             score -= 20
             suggestions.append("Include specific concept IDs for ontology mappings")
 
@@ -365,21 +398,17 @@ class QualityScoreCalculator:
         score = 100.0
 
         # Check for technical jargon without explanation
-        jargon_patterns = [
-            (r'\b(PHI|PII|HIPAA)\b', "Consider explaining acronyms"),
-            (r'\bNULL\b', "Explain what NULL/missing values mean"),
-        ]
-
-        for pattern, suggestion in jargon_patterns:
-            if re.search(pattern, content):
+        for pattern, suggestion in _JARGON_PATTERNS:
+            if pattern.search(content):
                 # Check if there's an explanation nearby
                 if 'means' not in content.lower() and 'defined as' not in content.lower():
                     score -= 5
                     suggestions.append(suggestion)
 
-        # Check sentence structure (basic)
-        sentences = content.split('.')
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+        # Check sentence structure (basic): words per '.'-separated sentence,
+        # counted without building a list per sentence
+        word_count = len(content.replace('.', ' ').split())
+        avg_sentence_length = word_count / (content.count('.') + 1)
 
         if avg_sentence_length > 30:
             score -= 10
@@ -392,6 +421,12 @@ class QualityScoreCalculator:
         return max(0, score)
 
 
+@functools.lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _score_content(content: str) -> Tuple:
+    """QualityScoreCalculator scores for content without metadata, shared by all calculators."""
+    return QualityScoreCalculator()._score(content, None)
+
+
 class QualityScoreWidget:
     """Visual widget for displaying quality scores."""
 
@@ -23,7 +23,7 @@ import pandas as pd
 import uuid
 import os
 import hashlib
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 import ipywidgets as widgets
@@ -98,6 +98,21 @@ class EnhancedDatabaseManager:
         rows = self.cursor.fetchall()
         return [dict(row) for row in rows]
 
+    def execute_query_iter(self, query: str, params: tuple = (), chunk_size: int = 1000) -> Iterator[Dict]:
+        """Execute SELECT query and yield result rows, fetching chunk_size at a time."""
+        # Own cursor, so other queries can run while the rows are consumed
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute INSERT/UPDATE/DELETE and return affected row ID."""
         self.cursor.execute(query, params)
@@ -0,0 +1,319 @@
+"""
+Test Suite for the Vertex AI Deployment Helper
+===============================================
+
+Usage:
+    python -m pytest tests/test_deploy_helper.py
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+import deploy_helper
+from deploy_helper import (
+    CONFIG_FILENAME,
+    CostEstimator,
+    DeploymentManager,
+    DeploymentValidator,
+    ValidationResult,
+    load_config,
+    _load_config,
+    _gcp_env,
+    _parse_memory_gb
+)
+
+
+def _write_config(agent_path, config):
+    path = os.path.join(agent_path, CONFIG_FILENAME)
+    with open(path, 'w') as f:
+        json.dump(config, f)
+    return path
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test the cached config loader."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.agent_path = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reuses_parsed_config_until_file_changes(self):
+        """Unchanged files are parsed once; a new mtime is re-read."""
+        path = _write_config(self.agent_path, {'min_instances': 0})
+
+        first = load_config(path)
+        self.assertIs(load_config(path), first)
+
+        _write_config(self.agent_path, {'min_instances': 2})
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        self.assertEqual(load_config(path)['min_instances'], 2)
+
+    def test_stdlib_json_fallback(self):
+        """Without orjson the config is parsed by the json module."""
+        path = _write_config(self.agent_path, {'min_instances': 1, 'resource_limits': {'memory': '4Gi'}})
+        with patch('deploy_helper.ORJSON_AVAILABLE', False):
+            config = _load_config(path, -1)
+        self.assertEqual(config, {'min_instances': 1, 'resource_limits': {'memory': '4Gi'}})
+
+    def test_invalid_json_is_not_cached(self):
+        """A parse error is raised every time rather than remembered."""
+        path = os.path.join(self.agent_path, CONFIG_FILENAME)
+        with open(path, 'w') as f:
+            f.write('{not json')
+
+        with self.assertRaises(json.JSONDecodeError):
+            load_config(path)
+        with self.assertRaises(json.JSONDecodeError):
+            load_config(path)
+
+
+class TestCostEstimator(unittest.TestCase):
+    """Test monthly cost estimates."""
+
+    CONFIGS = [
+        {'min_instances': 1, 'max_instances': 3, 'resource_limits': {'cpu': '2', 'memory': '4Gi'}},
+        {},
+        {'min_instances': 0, 'max_instances': 10, 'resource_limits': {'cpu': '4', 'memory': '16Gi'}},
+    ]
+
+    def test_single_estimate(self):
+        costs = CostEstimator().estimate_monthly_cost(self.CONFIGS[0])
+        self.assertEqual(costs, {
+            'always_on_monthly': 93.73,
+            'per_instance_hour': 0.1284,
+            'max_monthly': 281.2,
+            'currency': 'USD'
+        })
+
+    def test_fixed_size_deployment(self):
+        """With min == max the always-on and max costs are the same figure."""
+        costs = CostEstimator().estimate_monthly_cost(
+            {'min_instances': 2, 'max_instances': 2, 'resource_limits': {'cpu': '1', 'memory': '2Gi'}})
+        self.assertEqual(costs['always_on_monthly'], 93.73)
+        self.assertEqual(costs['max_monthly'], costs['always_on_monthly'])
+
+    def test_memory_units(self):
+        """Kubernetes binary and decimal suffixes convert to Gi; bare numbers are Gi."""
+        self.assertEqual(_parse_memory_gb('4Gi'), 4.0)
+        self.assertEqual(_parse_memory_gb('512Mi'), 0.5)
+        self.assertEqual(_parse_memory_gb('1Ti'), 1024.0)
+        self.assertEqual(_parse_memory_gb('8'), 8.0)
+        self.assertAlmostEqual(_parse_memory_gb('2G'), 2e9 / 1024 ** 3)
+        with self.assertRaises(ValueError):
+            _parse_memory_gb('lots')
+
+    def test_batch_matches_single_estimates(self):
+        estimator = CostEstimator()
+        batch = estimator.estimate_monthly_costs_batch(self.CONFIGS)
+
+        for i, config in enumerate(self.CONFIGS):
+            single = estimator.estimate_monthly_cost(config)
+            for key in ('always_on_monthly', 'per_instance_hour', 'max_monthly'):
+                self.assertAlmostEqual(batch[key][i], single[key])
+
+
+class TestGcpEnv(unittest.TestCase):
+    """Test project/region resolution from the environment."""
+
+    def tearDown(self):
+        _gcp_env.cache_clear()
+
+    def _resolve(self, env):
+        _gcp_env.cache_clear()
+        with patch.dict(os.environ, env, clear=True):
+            return _gcp_env()
+
+    def test_google_cloud_variables_take_precedence(self):
+        env = {'GOOGLE_CLOUD_PROJECT': 'gcp', 'PROJECT_ID': 'plain',
+               'GOOGLE_CLOUD_LOCATION': 'europe-west4', 'REGION': 'us-east1'}
+        self.assertEqual(self._resolve(env), ('gcp', 'europe-west4'))
+
+    def test_fallback_variables(self):
+        self.assertEqual(self._resolve({'PROJECT_ID': 'plain', 'REGION': 'us-east1'}), ('plain', 'us-east1'))
+        self.assertEqual(self._resolve({}), (None, None))
+
+
+class TestPrintResult(unittest.TestCase):
+    """Test formatting of validation output."""
+
+    def test_sections_skip_empty_lists(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            DeploymentManager('agent').print_result(ValidationResult(False, ['a', 'b'], [], ['c']))
+        self.assertEqual(output.getvalue(),
+                         "\n❌ ERRORS (2):\n  • a\n  • b\n\n✓ CHECKS PASSED (1):\n  • c\n")
+
+
+class TestValidationResult(unittest.TestCase):
+    """Test the validation result container."""
+
+    @unittest.skipIf(sys.version_info < (3, 10), 'dataclass slots need Python 3.10')
+    def test_uses_slots(self):
+        result = ValidationResult(True, [], [], [])
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertIsNone(result.parsed_config)
+
+
+class TestValidationCache(unittest.TestCase):
+    """Test reuse of successful validation results."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.agent_path = self.temp_dir.name
+        self.config_path = _write_config(self.agent_path, {'min_instances': 0, 'max_instances': 1})
+        self.manager = DeploymentManager(self.agent_path)
+        deploy_helper._VALIDATION_CACHE.clear()
+
+    def tearDown(self):
+        deploy_helper._VALIDATION_CACHE.clear()
+        self.temp_dir.cleanup()
+
+    def _validate(self, is_valid=True, manager=None):
+        manager = manager or self.manager
+        with patch.object(manager.validator, 'validate_all',
+                          return_value=ValidationResult(is_valid, [], [], [])) as validate_all, \
+                redirect_stdout(io.StringIO()):
+            manager.validate()
+        return validate_all.call_count
+
+    def test_unchanged_directory_reuses_result(self):
+        self.assertEqual(self._validate(), 1)
+        self.assertEqual(self._validate(), 0)
+
+    def test_new_manager_reuses_result(self):
+        """Validation is shared across managers, e.g. validate() then a CLI deploy."""
+        self.assertEqual(self._validate(), 1)
+        self.assertEqual(self._validate(manager=DeploymentManager(self.agent_path)), 0)
+
+    def test_unread_files_do_not_invalidate_result(self):
+        """Only the files the validator reads are part of the cache key."""
+        self._validate()
+        os.makedirs(os.path.join(self.agent_path, 'data'))
+        with open(os.path.join(self.agent_path, 'data', 'big.csv'), 'w') as f:
+            f.write('x')
+        self.assertEqual(self._validate(), 0)
+
+        # A required file appearing does count
+        with open(os.path.join(self.agent_path, 'agent.py'), 'w') as f:
+            f.write('root_agent = None')
+        self.assertEqual(self._validate(), 1)
+
+    def test_edit_invalidates_result(self):
+        self._validate()
+        os.utime(self.config_path, ns=(0, os.stat(self.config_path).st_mtime_ns + 1_000_000))
+        self.assertEqual(self._validate(), 1)
+
+    def test_failures_are_not_cached(self):
+        self.assertEqual(self._validate(is_valid=False), 1)
+        self.assertEqual(self._validate(is_valid=False), 1)
+
+    def test_environment_results_follow_directory_checks(self):
+        """The background environment check is merged after the directory checks."""
+        env_result = (['env error'], ['env warning'], ['env info'])
+        with patch.object(DeploymentValidator, '_check_environment', return_value=env_result):
+            result = DeploymentValidator().validate_all(self.agent_path)
+        self.assertEqual(result.errors[-1], 'env error')
+        self.assertEqual(result.warnings[-1], 'env warning')
+        self.assertIn('Missing required file: agent.py (Main agent code)', result.errors)
+        self.assertFalse(result.is_valid)
+
+    def test_validator_returns_parsed_config(self):
+        result = DeploymentValidator()._validate_config(self.agent_path)
+        self.assertEqual(result[3], {'min_instances': 0, 'max_instances': 1})
+
+    def test_cost_estimate_uses_parsed_config(self):
+        """The estimate comes from the validated config, not a second read of the file."""
+        config = {'min_instances': 1, 'max_instances': 3, 'resource_limits': {'cpu': '2', 'memory': '4Gi'}}
+        output = io.StringIO()
+        with patch.object(self.manager.validator, 'validate_all',
+                          return_value=ValidationResult(True, [], [], [], config)), \
+                patch('deploy_helper.load_config') as load, \
+                redirect_stdout(output):
+            self.manager.validate()
+        load.assert_not_called()
+        self.assertIn('Always-on cost: $93.73/month', output.getvalue())
+
+
+class TestDeploy(unittest.TestCase):
+    """Test running the deploy command."""
+
+    def _deploy(self, script, verbose, yes=False, interactive=True):
+        """Deploy with validation and a 'y' answer stubbed, running script instead of adk."""
+        real_popen = subprocess.Popen
+        fake_adk = lambda cmd, **kwargs: real_popen([sys.executable, '-c', script], **kwargs)
+
+        manager = DeploymentManager('agent', verbose=verbose)
+        output = io.StringIO()
+        with patch.object(manager, '_validate', return_value=(True, {}, '/agent/' + CONFIG_FILENAME)), \
+                patch('sys.stdin.isatty', return_value=interactive), \
+                patch('builtins.input', return_value='y'), \
+                patch('deploy_helper._find_adk', return_value='/usr/local/bin/adk'), \
+                patch('subprocess.Popen', side_effect=fake_adk), \
+                patch('deploy_helper._gcp_env', return_value=('test-project', None)), \
+                redirect_stdout(output):
+            success = manager.deploy(yes=yes)
+        return success, output.getvalue()
+
+    def test_streams_output_when_verbose(self):
+        success, output = self._deploy("print('uploading'); print('done')", verbose=True)
+        self.assertTrue(success)
+        self.assertIn('uploading\ndone\n', output)
+
+    def test_quiet_failure_shows_output_tail(self):
+        script = "import sys; print('step 1'); print('quota exceeded', file=sys.stderr); sys.exit(3)"
+        success, output = self._deploy(script, verbose=False)
+        self.assertFalse(success)
+        self.assertIn('failed with code 3', output)
+        self.assertIn('step 1\nquota exceeded\n', output)
+
+    def test_non_interactive_stdin_cancels_without_prompting(self):
+        manager = DeploymentManager('agent')
+        output = io.StringIO()
+        with patch.object(manager, '_validate', return_value=(True, {}, '/agent/' + CONFIG_FILENAME)), \
+                patch('sys.stdin.isatty', return_value=False), \
+                patch('builtins.input') as prompt, \
+                patch('subprocess.Popen') as popen, \
+                redirect_stdout(output):
+            self.assertFalse(manager.deploy())
+        prompt.assert_not_called()
+        popen.assert_not_called()
+        self.assertIn('--yes', output.getvalue())
+
+    def test_yes_deploys_without_a_terminal(self):
+        success, _ = self._deploy("print('done')", verbose=False, yes=True, interactive=False)
+        self.assertTrue(success)
+
+    def test_dry_run_uses_validated_config_path(self):
+        manager = DeploymentManager('agent')
+        output = io.StringIO()
+        with patch.object(manager, '_validate', return_value=(True, {}, '/abs/agent/' + CONFIG_FILENAME)) as validate, \
+                patch('deploy_helper._gcp_env', return_value=('test-project', None)), \
+                redirect_stdout(output):
+            self.assertTrue(manager.deploy(dry_run=True))
+        validate.assert_called_once_with()
+        self.assertIn(f'--agent_engine_config_file /abs/agent/{CONFIG_FILENAME}', output.getvalue())
+
+    def test_missing_adk_fails_before_running(self):
+        manager = DeploymentManager('agent')
+        with patch.object(manager, '_validate', return_value=(True, {}, '/agent/' + CONFIG_FILENAME)), \
+                patch('builtins.input', return_value='y'), \
+                patch('deploy_helper._find_adk', return_value=None), \
+                patch('subprocess.Popen') as popen, \
+                patch('deploy_helper._gcp_env', return_value=('test-project', None)), \
+                redirect_stdout(io.StringIO()):
+            self.assertFalse(manager.deploy())
+        popen.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,9 +9,11 @@ Usage in notebook:
     %run test_enhancements.py
 """
 
+import os
 import time
 import json
 from datetime import datetime
+import pytest
 
 
 def test_enhanced_hitl_dashboard():
@@ -42,6 +44,283 @@ def test_enhanced_hitl_dashboard():
         return False
 
 
+class _FakeReviewItem:
+    def __init__(self, item_id, source_agent="PlainLanguageAgent", content="Generated docs"):
+        self.item_id = item_id
+        self.source_agent = source_agent
+        self.source_data = '{"variable_name": "var_%d"}' % item_id
+        self.generated_content = content
+
+
+class _FakeReviewQueue:
+    """In-memory stand-in for the notebook's ReviewQueueManager."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.approved = []
+        self.fetches = 0
+
+    def get_pending_items(self, job_id):
+        self.fetches += 1
+        approved = set(self.approved)
+        return [item for item in self.items if item.item_id not in approved]
+
+    def approve_item(self, item_id, approved_content=None):
+        self.approved.append(item_id)
+
+
+def test_dashboard_debounces_navigation():
+    """Rapid navigation collapses into a single deferred render."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(i) for i in range(1, 6)])
+    dashboard = EnhancedHITLReviewDashboard(queue)
+    dashboard.current_job_id = 'job-1'
+    dashboard.load_pending_items()
+
+    renders = []
+    original = dashboard.update_display
+    dashboard.update_display = lambda: (renders.append(dashboard.current_index), original())
+
+    for index in range(1, 4):
+        dashboard.current_index = index
+        dashboard._schedule_update()
+    time.sleep(dashboard.UPDATE_DEBOUNCE_SECONDS * 4)
+
+    assert renders == [3]
+    assert 'Review Item 4 of 5' in dashboard.status_html.value
+
+
+def test_dashboard_debounce_renders_on_kernel_loop():
+    """Inside an event loop the debounced render runs on the loop's thread."""
+    pytest.importorskip('tornado')
+    import asyncio
+    import threading
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(i) for i in range(1, 4)])
+    dashboard = EnhancedHITLReviewDashboard(queue)
+    dashboard.current_job_id = 'job-1'
+    dashboard.load_pending_items()
+
+    render_threads = []
+    dashboard.update_display = lambda: render_threads.append(threading.current_thread())
+
+    async def navigate():
+        for index in range(1, 3):
+            dashboard.current_index = index
+            dashboard._schedule_update()
+        await asyncio.sleep(dashboard.UPDATE_DEBOUNCE_SECONDS * 4)
+
+    asyncio.run(navigate())
+    assert render_threads == [threading.current_thread()]
+
+
+def test_dashboard_batch_approve_prefers_bulk_api():
+    """Batch approvals use the queue's approve_items when it exists."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    class BulkQueue(_FakeReviewQueue):
+        def __init__(self, items):
+            super().__init__(items)
+            self.bulk_calls = []
+
+        def approve_items(self, item_ids):
+            self.bulk_calls.append(list(item_ids))
+            self.approved.extend(item_ids)
+
+    bulk_queue = BulkQueue([_FakeReviewItem(i) for i in range(1, 4)])
+    EnhancedHITLReviewDashboard(bulk_queue)._approve_items([1, 2, 3])
+    assert bulk_queue.bulk_calls == [[1, 2, 3]]
+
+    plain_queue = _FakeReviewQueue([_FakeReviewItem(i) for i in range(1, 4)])
+    EnhancedHITLReviewDashboard(plain_queue)._approve_items([1, 2, 3])
+    assert plain_queue.approved == [1, 2, 3]
+
+
+def test_dashboard_reuses_recent_pending_items():
+    """Auto-refresh within the TTL is served from cache; manual refresh is not."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(i) for i in range(1, 4)])
+    dashboard = EnhancedHITLReviewDashboard(queue, pending_cache_ttl=60)
+    dashboard.current_job_id = 'job-1'
+
+    dashboard.load_pending_items()
+    dashboard._refresh_items(silent=True)
+    assert queue.fetches == 1
+
+    dashboard._refresh_items(silent=True, force=True)
+    assert queue.fetches == 2
+
+    dashboard._approve_items([1])
+    dashboard._refresh_items(silent=True)
+    assert queue.fetches == 3
+    assert [item.item_id for item in dashboard.current_items] == [2, 3]
+
+
+def test_dashboard_refresh_interval_backs_off_when_idle():
+    """Unchanged polls stretch the interval; new items snap it back."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(1)])
+    dashboard = EnhancedHITLReviewDashboard(queue, auto_refresh_interval=30, pending_cache_ttl=0)
+    dashboard.current_job_id = 'job-1'
+    dashboard.load_pending_items()
+
+    dashboard._refresh_items(silent=True)
+    assert dashboard._current_refresh_interval == 45
+    for _ in range(20):
+        dashboard._refresh_items(silent=True)
+    assert dashboard._current_refresh_interval == dashboard.MAX_AUTO_REFRESH_INTERVAL
+
+    queue.items.append(_FakeReviewItem(2))
+    dashboard._refresh_items(silent=True)
+    assert dashboard._current_refresh_interval == 30
+
+
+def test_dashboard_previews_are_escaped_and_cached():
+    """Item previews are truncated, HTML-escaped, and built once per item."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    item = _FakeReviewItem(1, content='<script>alert(1)</script>' + 'x' * 2000)
+    dashboard = EnhancedHITLReviewDashboard(_FakeReviewQueue([item]))
+    dashboard.current_job_id = 'job-1'
+    dashboard.load_pending_items()
+
+    assert '<script>' not in dashboard.item_html.value
+    assert '&lt;script&gt;' in dashboard.item_html.value
+    source_preview, content_preview = dashboard._get_previews(item)
+    assert content_preview.endswith('...')
+    assert dashboard._get_previews(item)[1] is content_preview
+
+
+def test_dashboard_drops_duplicate_and_reviewed_items():
+    """Duplicates from the queue and locally approved items are not shown again."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    class LaggingQueue(_FakeReviewQueue):
+        def get_pending_items(self, job_id):
+            self.fetches += 1
+            return list(self.items)  # approvals not visible yet, plus a duplicate row
+
+    items = [_FakeReviewItem(1), _FakeReviewItem(2), _FakeReviewItem(3)]
+    queue = LaggingQueue(items + [items[1]])
+    dashboard = EnhancedHITLReviewDashboard(queue, pending_cache_ttl=0)
+    dashboard.current_job_id = 'job-1'
+
+    dashboard.load_pending_items()
+    assert [item.item_id for item in dashboard.current_items] == [1, 2, 3]
+
+    dashboard._approve_items([1])
+    dashboard.load_pending_items()
+    assert [item.item_id for item in dashboard.current_items] == [2, 3]
+
+
+def test_dashboard_fills_edit_area_only_in_edit_mode():
+    """Navigating does not copy content into the textarea until editing starts."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(1, content='first'), _FakeReviewItem(2, content='second')])
+    dashboard = EnhancedHITLReviewDashboard(queue)
+    dashboard.current_job_id = 'job-1'
+    dashboard.load_pending_items()
+    assert dashboard.edit_area.value == ''
+
+    dashboard.toggle_edit_mode()
+    assert dashboard.edit_area.value == 'first'
+    dashboard.edit_area.value = 'first (edited)'
+    dashboard.toggle_edit_mode()
+
+    dashboard.update_display()
+    assert dashboard.edit_area.value == 'first (edited)'
+
+    dashboard.current_index = 1
+    dashboard.update_display()
+    assert dashboard.edit_area.value == ''
+
+
+def test_dashboard_skips_render_when_items_unchanged():
+    """A refresh returning the same items does not touch the widgets."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(1), _FakeReviewItem(2)])
+    dashboard = EnhancedHITLReviewDashboard(queue, pending_cache_ttl=0)
+    dashboard.current_job_id = 'job-1'
+
+    renders = []
+    original = dashboard.update_display
+    dashboard.update_display = lambda: (renders.append(len(dashboard.current_items)), original())
+
+    dashboard.load_pending_items()
+    dashboard.load_pending_items()
+    assert renders == [2]
+
+    queue.items.append(_FakeReviewItem(3))
+    dashboard.load_pending_items()
+    assert renders == [2, 3]
+
+
+def test_dashboard_create_widget_reuses_layout():
+    """A second create_widget call switches jobs without rebuilding or rewiring."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    queue = _FakeReviewQueue([_FakeReviewItem(1)])
+    dashboard = EnhancedHITLReviewDashboard(queue)
+    dashboard.auto_refresh_checkbox.value = False
+
+    first = dashboard.create_widget('job-1')
+    second = dashboard.create_widget('job-2')
+
+    assert second is first
+    assert dashboard.current_job_id == 'job-2'
+    assert dashboard._job_input.value == 'job-2'
+    assert len(dashboard.approve_button._click_handlers.callbacks) == 1
+
+
+def test_dashboard_stats_render_only_on_change():
+    """Re-rendering with unchanged counters leaves stats_html alone."""
+    from agentic_enhancements import EnhancedHITLReviewDashboard
+
+    dashboard = EnhancedHITLReviewDashboard(_FakeReviewQueue([_FakeReviewItem(1)]))
+    dashboard.current_job_id = 'job-1'
+    dashboard.load_pending_items()
+
+    dashboard.stats_html.value = 'sentinel'
+    dashboard.update_stats_display()
+    assert dashboard.stats_html.value == 'sentinel'
+
+    dashboard.stats.skipped += 1
+    dashboard.update_stats_display()
+    assert '<strong>Skipped:</strong> 1' in dashboard.stats_html.value
+
+
+def test_parse_rate_limit_headers():
+    """Retry hints come from retry_after, then Retry-After, then X-RateLimit-Reset."""
+    from agentic_enhancements import EnhancedBaseAgent
+
+    class MockResponse:
+        def __init__(self, headers):
+            self.headers = headers
+
+    class MockError(Exception):
+        def __init__(self, headers=None, retry_after=None):
+            super().__init__('429 Too Many Requests')
+            if retry_after is not None:
+                self.retry_after = retry_after
+            if headers is not None:
+                self.response = MockResponse(headers)
+
+    agent = EnhancedBaseAgent("TestAgent", "Test prompt")
+    assert agent._parse_rate_limit_headers(MockError(retry_after=15.5)) == 15.5
+    assert agent._parse_rate_limit_headers(MockError({'Retry-After': '7'})) == 7.0
+    reset = agent._parse_rate_limit_headers(MockError({'X-RateLimit-Reset': str(time.time() + 30)}))
+    assert 25 < reset <= 30
+    assert agent._parse_rate_limit_headers(MockError({'Retry-After': 'soon'})) is None
+    assert agent._parse_rate_limit_headers(MockError(headers='not-a-mapping')) is None
+    assert agent._parse_rate_limit_headers(ValueError('boom')) is None
+
+
 def test_smart_retry_logic():
     """Test the smart retry logic with exponential backoff."""
     print("\n" + "="*70)
@@ -190,6 +469,269 @@ def test_progress_persistence():
         return False
 
 
+def _checkpoint(stage='analyzed', job_id='job-1', processed=('var1',)):
+    from agentic_enhancements import ProcessingCheckpoint
+
+    return ProcessingCheckpoint(
+        job_id=job_id,
+        checkpoint_time=datetime.now().isoformat(),
+        stage=stage,
+        variables_processed=len(processed),
+        total_variables=5,
+        parsed_data=[{'var': 'var1', 'label': 'Ünïcode'}],
+        analyzed_data=[{'var': 'var1', 'type': 'string'}],
+        processed_variables=list(processed)
+    )
+
+
+@pytest.mark.parametrize('use_orjson', [False, True])
+def test_checkpoint_round_trip_json(tmp_path, monkeypatch, use_orjson):
+    """JSON checkpoints still round-trip when MessagePack is turned off."""
+    import agentic_enhancements
+    from agentic_enhancements import ProgressPersistenceManager
+
+    if use_orjson:
+        pytest.importorskip('orjson')
+    monkeypatch.setattr(agentic_enhancements, 'ORJSON_AVAILABLE', use_orjson)
+
+    pm = ProgressPersistenceManager(checkpoint_dir=str(tmp_path), use_msgpack=False, compress=False)
+    path = pm.save_checkpoint(_checkpoint())
+    assert path.endswith('.json')
+
+    loaded = pm.load_checkpoint('job-1', stage='analyzed')
+    assert loaded.parsed_data == [{'var': 'var1', 'label': 'Ünïcode'}]
+    assert [cp['stage'] for cp in pm.list_checkpoints('job-1')] == ['analyzed']
+
+
+def test_checkpoint_round_trip_msgpack(tmp_path):
+    """MessagePack checkpoints round-trip and JSON ones remain readable."""
+    pytest.importorskip('msgspec')
+    from agentic_enhancements import ProgressPersistenceManager
+
+    with ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=False) as legacy:
+        legacy.save_checkpoint(_checkpoint('parsed'))
+    pm = ProgressPersistenceManager(checkpoint_dir=str(tmp_path), use_msgpack=True, compress=False)
+    path = pm.save_checkpoint(_checkpoint())
+    assert path.endswith('.msgpack')
+
+    assert pm.load_checkpoint('job-1', stage='analyzed').analyzed_data == [{'var': 'var1', 'type': 'string'}]
+    assert pm.load_checkpoint('job-1', stage='parsed').stage == 'parsed'
+    assert pm.load_checkpoint('job-1').stage == 'analyzed'
+    assert len(pm.list_checkpoints('job-1')) == 2
+
+    pm.cleanup_old_checkpoints('job-1', keep_latest=0)
+    assert pm.list_checkpoints('job-1') == []
+
+
+def test_checkpoint_data_is_zstd_compressed(tmp_path):
+    """Compressed checkpoints round-trip and keep a readable header."""
+    pytest.importorskip('zstandard')
+    from agentic_enhancements import ProgressPersistenceManager
+
+    with ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=False) as plain:
+        plain.save_checkpoint(_checkpoint('parsed'))
+
+    pm = ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=True)
+    path = pm.save_checkpoint(_checkpoint())
+    assert path.endswith('.json.zst')
+
+    assert pm.load_checkpoint('job-1', stage='analyzed').parsed_data == [{'var': 'var1', 'label': 'Ünïcode'}]
+    assert pm.load_checkpoint('job-1', stage='parsed').stage == 'parsed'
+    assert sorted(cp['stage'] for cp in pm.list_checkpoints('job-1')) == ['analyzed', 'parsed']
+
+
+def test_list_checkpoints_reads_only_headers(tmp_path):
+    """Listing decodes the header frame; older single-document files still load."""
+    from agentic_enhancements import ProgressPersistenceManager
+
+    pm = ProgressPersistenceManager(str(tmp_path), use_msgpack=False, background_writes=False)
+    path = pm.save_checkpoint(_checkpoint())
+
+    # Corrupt the bulk data: listing must not need it
+    with open(path, 'r+b') as f:
+        f.seek(-3, os.SEEK_END)
+        f.write(b'???')
+    assert [cp['progress'] for cp in pm.list_checkpoints('job-1')] == ['1/5']
+
+    legacy = dict(_checkpoint('parsed').__dict__, checkpoint_file=None)
+    (tmp_path / 'job-1_parsed.json').write_text(json.dumps(legacy, indent=2))
+    assert pm.load_checkpoint('job-1', stage='parsed').parsed_data == legacy['parsed_data']
+
+
+def test_progress_log_replays_on_analyzed_base(tmp_path):
+    """Per-variable progress is appended to a log and replayed on load."""
+    from agentic_enhancements import ProgressPersistenceManager
+
+    pm = ProgressPersistenceManager(checkpoint_dir=str(tmp_path), use_msgpack=False)
+    base = _checkpoint(processed=())
+    pm.save_checkpoint(base)
+    pm.append_progress('job-1', ['var1'])
+    pm.append_progress('job-1', ['var2', 'var3'])
+
+    # A crash mid-write leaves a partial frame at the end of the log
+    with open(tmp_path / 'job-1_progress.log', 'ab') as f:
+        f.write(b'\x00\x00\x00\x40{"vari')
+
+    loaded = pm.load_checkpoint('job-1', stage='ontology')
+    assert loaded.stage == 'ontology'
+    assert loaded.processed_variables == ['var1', 'var2', 'var3']
+    assert loaded.variables_processed == 3
+    # Replayed progress is stamped with the last batch's time, not the base's
+    assert loaded.checkpoint_time >= base.checkpoint_time
+    assert loaded.analyzed_data == [{'var': 'var1', 'type': 'string'}]
+
+    pm.clear_progress('job-1')
+    assert not (tmp_path / 'job-1_progress.log').exists()
+    assert pm.load_checkpoint('job-1').stage == 'analyzed'
+    pm.close()
+
+
+def test_checkpoints_written_in_background(tmp_path):
+    """Queued saves land on disk by flush/close, newest data per file wins."""
+    from agentic_enhancements import ProgressPersistenceManager
+
+    with ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=False,
+                                    background_writes=True) as pm:
+        pm.save_checkpoint(_checkpoint(processed=('var1',)))
+        pm.save_checkpoint(_checkpoint(processed=('var1', 'var2')))
+        pm.flush()
+        assert pm.load_checkpoint('job-1', stage='analyzed').processed_variables == ['var1', 'var2']
+
+        # Same stage and progress but different data still replaces the file
+        pm.save_checkpoint(_checkpoint(processed=('var1', 'var3')))
+        assert pm.load_checkpoint('job-1', stage='analyzed').processed_variables == ['var1', 'var3']
+
+        pm.save_checkpoint(_checkpoint('documented'))
+    assert pm._pending.writer is None
+    assert (tmp_path / 'job-1_documented.json').exists()
+
+
+def test_background_write_errors_reach_the_caller(tmp_path, monkeypatch):
+    """A failed background write is raised from flush, not only logged."""
+    from agentic_enhancements import ProgressPersistenceManager
+
+    def fail(path, data):
+        raise OSError('disk full')
+
+    pm = ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=False, background_writes=True)
+    monkeypatch.setattr(pm._pending, 'write_file', fail)
+    pm.save_checkpoint(_checkpoint())
+    with pytest.raises(OSError, match='disk full'):
+        pm.flush()
+    # Reported once; later saves and close() proceed normally
+    monkeypatch.undo()
+    pm.save_checkpoint(_checkpoint('documented'))
+    pm.close()
+    assert (tmp_path / 'job-1_documented.json').exists()
+
+
+def test_open_managers_are_closed_at_exit(tmp_path):
+    """Writes queued by a manager that is never closed still reach disk."""
+    import subprocess
+    import sys
+
+    script = (
+        "import sys; sys.path.insert(0, {root!r}); sys.path.insert(0, {tests!r})\n"
+        "from agentic_enhancements import ProgressPersistenceManager\n"
+        "from test_enhancements import _checkpoint\n"
+        "pm = ProgressPersistenceManager({dir!r}, use_msgpack=False, compress=False, background_writes=True)\n"
+        "pm.save_checkpoint(_checkpoint())\n"
+        "pm.record_progress('job-1', 'var9')\n"
+    ).format(root=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+             tests=os.path.dirname(os.path.abspath(__file__)), dir=str(tmp_path))
+    subprocess.run([sys.executable, '-c', script], check=True, capture_output=True)
+
+    assert (tmp_path / 'job-1_analyzed.json').exists()
+    assert (tmp_path / 'job-1_progress.log').exists()
+
+
+def test_collected_managers_write_pending_data(tmp_path):
+    """A manager dropped without close() still writes what it buffered."""
+    import gc
+    from agentic_enhancements import ProgressPersistenceManager
+
+    pm = ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=False, background_writes=True)
+    pm.save_checkpoint(_checkpoint())
+    pm.record_progress('job-1', 'var9')
+    del pm
+    gc.collect()
+
+    assert (tmp_path / 'job-1_analyzed.json').exists()
+    with ProgressPersistenceManager(str(tmp_path), use_msgpack=False, compress=False) as pm:
+        assert pm.read_progress('job-1') == ['var9']
+
+
+def test_progress_is_batched_by_flush_interval(tmp_path):
+    """Buffered variables reach the log once per flush_interval, or on flush."""
+    from agentic_enhancements import ProgressPersistenceManager
+
+    pm = ProgressPersistenceManager(str(tmp_path), use_msgpack=False, flush_interval=3)
+    log = tmp_path / 'job-1_progress.log'
+
+    pm.record_progress('job-1', 'var1')
+    pm.record_progress('job-1', 'var2')
+    assert not log.exists()
+
+    pm.record_progress('job-1', 'var3')
+    pm.record_progress('job-1', 'var4')
+    assert log.read_bytes().count(b'variables') == 1
+
+    # Reading flushes the tail so nothing buffered is reported missing
+    assert pm.read_progress('job-1') == ['var1', 'var2', 'var3', 'var4']
+    assert log.read_bytes().count(b'variables') == 2
+
+
+class _FakeOrchestrator:
+    """Minimal pipeline for process_with_checkpoints; fails on one variable if asked."""
+
+    def __init__(self, variables, fail_on=None):
+        from types import SimpleNamespace
+
+        self.documented = []
+        self.fail_on = fail_on
+        self.data_parser = SimpleNamespace(parse_csv=lambda data: [{'original_name': v} for v in variables])
+        self.technical_analyzer = SimpleNamespace(analyze=lambda parsed: [dict(p, variable_name=p['original_name']) for p in parsed])
+        self.domain_ontology = SimpleNamespace(map_ontologies=self._map)
+        self.plain_language = SimpleNamespace(document_variable=lambda data: f"doc {data['variable_name']}")
+        self.review_queue = SimpleNamespace(add_item=self._add_item, approve_item=lambda item_id: None)
+        self.db = SimpleNamespace(execute_update=lambda query, params: None)
+
+    def create_job(self, source_file):
+        return 'job-1'
+
+    def _map(self, var_data):
+        if var_data['variable_name'] == self.fail_on:
+            raise RuntimeError('ontology service unavailable')
+        return {'ontology': 'none'}
+
+    def _add_item(self, job_id, source_agent, source_data, generated_content):
+        self.documented.append(json.loads(source_data)['variable_name'])
+        return len(self.documented)
+
+
+def test_process_with_checkpoints_resumes_after_failure(tmp_path, monkeypatch):
+    """A failed run resumes from the progress log without redoing finished variables."""
+    from agentic_enhancements import add_progress_persistence_to_orchestrator, ProgressPersistenceManager
+
+    monkeypatch.chdir(tmp_path)
+    add_progress_persistence_to_orchestrator(_FakeOrchestrator)
+    variables = [f"var{i}" for i in range(12)]
+
+    failing = _FakeOrchestrator(variables, fail_on='var10')
+    with pytest.raises(RuntimeError):
+        failing.process_with_checkpoints('csv')
+    assert failing.documented == variables[:10]
+
+    resumed = _FakeOrchestrator(variables)
+    assert resumed.process_with_checkpoints('csv') == 'job-1'
+    assert resumed.documented == variables[10:]
+
+    final = ProgressPersistenceManager().load_checkpoint('job-1')
+    assert final.stage == 'documented'
+    assert final.processed_variables == variables
+    assert not (tmp_path / 'checkpoints' / 'job-1_progress.log').exists()
+
+
 def test_orchestrator_enhancement():
     """Test the orchestrator enhancement for checkpoints."""
     print("\n" + "="*70)
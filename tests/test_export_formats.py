@@ -0,0 +1,326 @@
+"""
+Tests for Export Format Implementations
+
+Tests the exporters from features_export_formats.py:
+1. HTML dashboard export
+2. JSON Schema export
+3. REDCap data dictionary export
+"""
+
+import csv
+import pytest
+import sqlite3
+import json
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import features_export_formats
+from features_export_formats import HTMLDashboardExporter, JSONSchemaExporter, REDCapExporter, _parse_source
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def temp_db():
+    """Create in-memory ReviewQueue database for testing."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        CREATE TABLE ReviewQueue (
+            item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            source_agent TEXT NOT NULL,
+            source_data TEXT NOT NULL,
+            generated_content TEXT NOT NULL,
+            approved_content TEXT,
+            status TEXT DEFAULT 'Pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Mock database manager
+    class MockDB:
+        def __init__(self, conn):
+            self.conn = conn
+            self.cursor = conn.cursor()
+
+        def execute_query(self, query, params=()):
+            self.cursor.execute(query, params)
+            rows = self.cursor.fetchall()
+            return [dict(row) for row in rows]
+
+        def execute_update(self, query, params=()):
+            self.cursor.execute(query, params)
+            self.conn.commit()
+            return self.cursor.lastrowid
+
+    yield MockDB(conn)
+
+    conn.close()
+
+
+@pytest.fixture
+def sample_documentation():
+    """Sample documentation content for testing."""
+    return """## Description: Systolic blood pressure measurement. Taken at clinic visits
+
+Valid Range: 70-250 mmHg
+
+**Ontology Mappings:**
+- LOINC: 8480-6 (Systolic blood pressure)
+- OMOP: 3004249 (Systolic blood pressure)
+"""
+
+
+def add_item(db, source, content, job_id="job-1", status="Approved"):
+    """Insert a review item and return its id."""
+    return db.execute_update("""
+        INSERT INTO ReviewQueue (job_id, source_agent, source_data, generated_content, status)
+        VALUES (?, ?, ?, ?, ?)
+    """, (job_id, "TestAgent", json.dumps(source), content, status))
+
+
+# ============================================================================
+# SOURCE DATA PARSING
+# ============================================================================
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_source(monkeypatch, use_orjson):
+    """Test source_data parsing with and without orjson."""
+    if use_orjson and not features_export_formats.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(features_export_formats, "ORJSON_AVAILABLE", use_orjson)
+
+    assert _parse_source('{"variable_name": "age"}') == {"variable_name": "age"}
+    assert _parse_source("not json") == {}
+    assert _parse_source(None) == {}
+    assert _parse_source("") == {}
+    assert _parse_source(b'{"data_type": "int"}') == {"data_type": "int"}
+
+
+# ============================================================================
+# HTML DASHBOARD EXPORT
+# ============================================================================
+
+def test_html_export(temp_db, sample_documentation, tmp_path):
+    """Test the dashboard lists each approved variable with a detail panel."""
+    add_item(temp_db, {"variable_name": "bp_systolic", "data_type": "integer"}, sample_documentation)
+    add_item(temp_db, {"variable_name": "sex", "data_type": "string"}, "## Description: Sex at birth")
+    add_item(temp_db, {"variable_name": "pending_var"}, "Not approved", status="Pending")
+
+    output_path = str(tmp_path / "dashboard.html")
+    result = HTMLDashboardExporter(temp_db).export_to_html("job-1", output_path)
+
+    assert result == output_path
+    with open(output_path, encoding='utf-8') as f:
+        html = f.read()
+
+    assert html.startswith("<!DOCTYPE html>")
+    assert "Data Dictionary Dashboard - job-1" in html
+    assert html.count("<tr onclick=") == 2
+    assert 'onclick="showDetails(0)"' in html
+    assert 'id="details-0"' in html
+    assert 'id="details-1"' in html
+    assert "pending_var" not in html
+    assert "Systolic blood pressure measurement" in html
+    assert '<span class="badge badge-ontology">LOINC</span>' in html
+    assert '<span class="badge badge-ontology">SNOMED</span>' not in html
+
+    # Search index: one lowercased entry per row, badge markup stripped
+    index_line = next(line for line in html.splitlines() if "const searchIndex" in line)
+    search_index = json.loads(index_line.split("=", 1)[1].strip().rstrip(";"))
+    assert len(search_index) == 2
+    assert search_index[0].startswith("bp_systolic integer systolic blood pressure measurement omoploinc")
+    assert "<span" not in search_index[0]
+
+
+def test_html_export_escapes_values(temp_db, tmp_path):
+    """Test names and descriptions cannot inject markup or script."""
+    add_item(temp_db, {"variable_name": "x'); alert(1); ('<b>", "data_type": "<i>"},
+             "## Description: Uses <script> tags")
+    add_item(temp_db, {"variable_name": "x'); alert(1); ('<b>"}, "Duplicate name")
+
+    output_path = HTMLDashboardExporter(temp_db).export_to_html("job-1", str(tmp_path / "d.html"))
+    with open(output_path, encoding='utf-8') as f:
+        html = f.read()
+
+    assert "<td>x&#x27;); alert(1); (&#x27;&lt;b&gt;</td>" in html
+    assert "&lt;i&gt;" in html
+    assert "Uses &lt;script&gt; tags" in html
+    assert "alert(1); ('<b>" not in html
+    # Duplicate names still get their own panels
+    assert 'id="details-0"' in html and 'id="details-1"' in html
+
+
+def test_markdown_to_html():
+    """Test block structure, inline markup and escaping of the markdown converter."""
+    markdown = (
+        "## Overview\n"
+        "Intro with **bold** and `a<b`\n"
+        "continued\n"
+        "\n"
+        "- first\n"
+        "- second\n"
+        "Not a list <item>\n"
+        "### Notes\n"
+        "`**not bold**`"
+    )
+    assert HTMLDashboardExporter._markdown_to_html(markdown) == "\n".join([
+        "<h2>Overview</h2>",
+        "<p>Intro with <strong>bold</strong> and <code>a&lt;b</code> continued</p>",
+        "<ul><li>first</li><li>second</li></ul>",
+        "<p>Not a list &lt;item&gt;</p>",
+        "<h3>Notes</h3>",
+        "<p><code>**not bold**</code></p>",
+    ])
+
+
+def test_html_export_no_approved_items(temp_db, tmp_path):
+    """Test export fails when the job has nothing approved."""
+    with pytest.raises(ValueError, match="No approved items"):
+        HTMLDashboardExporter(temp_db).export_to_html("job-1", str(tmp_path / "empty.html"))
+
+
+def test_html_export_unparseable_source(temp_db, tmp_path):
+    """Test items with invalid source JSON are still exported."""
+    temp_db.execute_update("""
+        INSERT INTO ReviewQueue (job_id, source_agent, source_data, generated_content, status)
+        VALUES ('job-1', 'TestAgent', 'not json', 'Some content', 'Approved')
+    """)
+
+    output_path = HTMLDashboardExporter(temp_db).export_to_html("job-1", str(tmp_path / "d.html"))
+
+    with open(output_path, encoding='utf-8') as f:
+        assert "Unknown" in f.read()
+
+
+# ============================================================================
+# JSON SCHEMA EXPORT
+# ============================================================================
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_schema_export(temp_db, sample_documentation, tmp_path, monkeypatch, use_orjson):
+    """Test field types, constraints, enums and ontology mappings."""
+    if use_orjson and not features_export_formats.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(features_export_formats, "ORJSON_AVAILABLE", use_orjson)
+
+    add_item(temp_db, {"variable_name": "bp_systolic", "data_type": "Integer", "nullable": False},
+             sample_documentation)
+    add_item(temp_db, {"variable_name": "sex", "data_type": "int"},
+             "## Description: Sex at birth\n\nValid Values:\n1: Male\n2: Female\n")
+    add_item(temp_db, {"variable_name": "visit_time", "data_type": "timestamp"}, "No sections")
+
+    output_path = str(tmp_path / "schema.json")
+    JSONSchemaExporter(temp_db).export_to_json_schema("job-1", output_path)
+
+    with open(output_path, encoding='utf-8') as f:
+        schema = json.load(f)
+
+    assert schema["$schema"] == "http://json-schema.org/draft-07/schema#"
+    assert schema["required"] == ["bp_systolic"]
+
+    bp = schema["properties"]["bp_systolic"]
+    assert bp["type"] == "integer"
+    assert bp["minimum"] == 70.0
+    assert bp["maximum"] == 250.0
+    assert bp["x-ontology-mappings"] == {"omop_concept_id": "3004249", "loinc_code": "8480-6"}
+
+    assert schema["properties"]["sex"]["enum"] == [1, 2]
+    assert schema["properties"]["visit_time"] == {
+        "description": "No description available",
+        "type": "string",
+        "format": "date-time"
+    }
+
+
+def test_json_schema_repeated_content(temp_db, tmp_path):
+    """Test identical fields share one schema without leaking into later exports."""
+    content = "Valid Values:\n1: Yes\n2: No\n\nOMOP: 4188539"
+    add_item(temp_db, {"variable_name": "smoker", "data_type": "int"}, content)
+    add_item(temp_db, {"variable_name": "drinker", "data_type": "int"}, content)
+    add_item(temp_db, {"variable_name": "height", "data_type": "float"}, content)
+
+    exporter = JSONSchemaExporter(temp_db)
+    items = temp_db.execute_query("SELECT * FROM ReviewQueue")
+    schema = exporter._build_schema(items, "job-1")
+    smoker = schema["properties"]["smoker"]
+
+    assert schema["properties"]["drinker"] is smoker
+    assert schema["properties"]["height"]["type"] == "number"
+
+    # Cached extraction results are copied, so edits stay in this schema
+    smoker["enum"].append(3)
+    smoker["x-ontology-mappings"]["loinc_code"] = "1-1"
+    fresh = exporter._build_schema(items, "job-1")["properties"]["smoker"]
+    assert fresh["enum"] == [1, 2]
+    assert fresh["x-ontology-mappings"] == {"omop_concept_id": "4188539"}
+
+
+# ============================================================================
+# REDCAP EXPORT
+# ============================================================================
+
+def test_redcap_export(temp_db, sample_documentation, tmp_path):
+    """Test REDCap rows carry types, choices, ranges and ontology notes."""
+    add_item(temp_db, {"variable_name": "bp_systolic", "data_type": "Integer"}, sample_documentation)
+    add_item(temp_db, {"variable_name": "sex", "data_type": "int"},
+             "Description: Sex at birth\n\nValid Values:\n1: Male\n2. Female\n")
+    add_item(temp_db, {"variable_name": "notes", "data_type": "text"}, "No sections")
+
+    output_path = str(tmp_path / "redcap.csv")
+    REDCapExporter(temp_db).export_to_redcap("job-1", output_path, form_name="vitals")
+
+    with open(output_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames
+        rows = list(reader)
+
+    assert len(columns) == 18
+    assert columns[:4] == ['Variable / Field Name', 'Form Name', 'Section Header', 'Field Type']
+    assert [row['Variable / Field Name'] for row in rows] == ['bp_systolic', 'sex', 'notes']
+    assert all(row['Form Name'] == 'vitals' and row['Section Header'] == '' for row in rows)
+
+    bp, sex, notes = rows
+    assert bp['Field Type'] == 'text'
+    assert bp['Text Validation Type OR Show Slider Number'] == 'integer'
+    assert (bp['Text Validation Min'], bp['Text Validation Max']) == ('70', '250')
+    assert bp['Field Note'] == 'OMOP: 3004249 | LOINC: 8480-6'
+
+    assert sex['Field Type'] == 'radio'
+    assert sex['Field Label'] == 'Sex at birth'
+    assert sex['Choices, Calculations, OR Slider Labels'] == '1, Male | 2, Female'
+
+    assert notes['Field Type'] == 'notes'
+    assert notes['Field Label'] == 'No description'
+    assert notes['Text Validation Min'] == ''
+
+
+def test_redcap_export_streams_rows(temp_db, sample_documentation, tmp_path, monkeypatch):
+    """Test rows come from execute_query_iter when the database manager has it."""
+    add_item(temp_db, {"variable_name": "bp_systolic", "data_type": "Integer"}, sample_documentation)
+    add_item(temp_db, {"variable_name": "sex", "data_type": "int"}, "Description: Sex at birth")
+    rows = temp_db.execute_query("SELECT * FROM ReviewQueue")
+
+    def fail(query, params=()):
+        raise AssertionError("execute_query should not be used")
+
+    monkeypatch.setattr(temp_db, "execute_query_iter", lambda query, params=(): iter(rows), raising=False)
+    monkeypatch.setattr(temp_db, "execute_query", fail)
+
+    output_path = REDCapExporter(temp_db).export_to_redcap("job-1", str(tmp_path / "redcap.csv"))
+    with open(output_path, newline='', encoding='utf-8') as f:
+        assert [row['Variable / Field Name'] for row in csv.DictReader(f)] == ['bp_systolic', 'sex']
+
+    monkeypatch.setattr(temp_db, "execute_query_iter", lambda query, params=(): iter([]))
+    with pytest.raises(ValueError, match="No approved items"):
+        REDCapExporter(temp_db).export_to_redcap("job-1", str(tmp_path / "empty.csv"))
+    assert not (tmp_path / "empty.csv").exists()
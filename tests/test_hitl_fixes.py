@@ -89,6 +89,17 @@ class TestEnhancedDatabaseManager(unittest.TestCase):
         results = self.db.execute_query("SELECT * FROM test_table")
         self.assertEqual(len(results), 2)
 
+    def test_execute_query_iter(self):
+        """Test rows are streamed in order across chunk boundaries."""
+        for i in range(5):
+            self.db.execute_update("INSERT INTO test_table (value) VALUES (?)", (f"v{i}",))
+
+        rows = self.db.execute_query_iter("SELECT value FROM test_table WHERE id > ? ORDER BY id", (1,), chunk_size=2)
+        self.assertEqual(next(rows), {'value': 'v1'})
+        # The shared cursor stays usable mid-iteration
+        self.assertEqual(len(self.db.execute_query("SELECT * FROM test_table")), 5)
+        self.assertEqual([row['value'] for row in rows], ['v2', 'v3', 'v4'])
+
 
 class TestSafeDocumentUploader(unittest.TestCase):
     """Test file size validation and Excel handling."""
@@ -272,6 +272,29 @@ def test_quality_score_suggestions():
     assert len(metrics.suggestions) > 0
 
 
+def test_quality_score_cached(monkeypatch):
+    """Test repeated content is scored once across calculators and results stay independent."""
+    calls = []
+    assess = QualityScoreCalculator._assess_completeness
+    monkeypatch.setattr(QualityScoreCalculator, "_assess_completeness",
+                        lambda *args: calls.append(1) or assess(*args))
+
+    content = "## Variable: cached_var\n\n**Description:** A cached variable"
+    calculator = QualityScoreCalculator()
+    first = calculator.calculate_score(content)
+    first.issues.append("edited")
+    # A fresh calculator (as each Excel export creates) reuses the cached scores
+    second = QualityScoreCalculator().calculate_score(content)
+
+    assert len(calls) == 1
+    assert second.overall_score == first.overall_score
+    assert "edited" not in second.issues
+
+    # Scoring with metadata bypasses the cache
+    calculator.calculate_score(content, {"mappings": [{"system": "OMOP"}]})
+    assert len(calls) == 2
+
+
 # ============================================================================
 # TEST FEATURE 3: EXCEL EXPORT
 # ============================================================================